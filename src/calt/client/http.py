@@ -21,6 +21,15 @@ def _build_authorization_header(token: str) -> str:
     return f"Bearer {normalized_token}"
 
 
+def _page_params(*, cursor: int | None, limit: int | None) -> dict[str, str]:
+    params: dict[str, str] = {}
+    if cursor is not None:
+        params["cursor"] = str(cursor)
+    if limit is not None:
+        params["limit"] = str(limit)
+    return params
+
+
 class DaemonApiClient:
     def __init__(
         self,
@@ -135,18 +144,36 @@ class DaemonApiClient:
     async def stop_session(self, session_id: str) -> dict[str, Any]:
         return await self._request("POST", f"/api/v1/sessions/{session_id}/stop")
 
-    async def search_events(self, session_id: str, q: str | None = None) -> dict[str, Any]:
-        params: dict[str, str] | None = None
+    async def search_events(
+        self,
+        session_id: str,
+        q: str | None = None,
+        *,
+        cursor: int | None = None,
+        limit: int | None = None,
+    ) -> dict[str, Any]:
+        params = _page_params(cursor=cursor, limit=limit)
         if q is not None:
-            params = {"q": q}
+            params["q"] = q
         return await self._request(
             "GET",
             f"/api/v1/sessions/{session_id}/events/search",
-            params=params,
+            params=params or None,
         )
 
-    async def list_artifacts(self, session_id: str) -> dict[str, Any]:
-        return await self._request("GET", f"/api/v1/sessions/{session_id}/artifacts")
+    async def list_artifacts(
+        self,
+        session_id: str,
+        *,
+        cursor: int | None = None,
+        limit: int | None = None,
+    ) -> dict[str, Any]:
+        params = _page_params(cursor=cursor, limit=limit)
+        return await self._request(
+            "GET",
+            f"/api/v1/sessions/{session_id}/artifacts",
+            params=params or None,
+        )
 
     async def list_tools(self) -> dict[str, Any]:
         return await self._request("GET", "/api/v1/tools")
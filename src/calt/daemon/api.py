@@ -2,18 +2,30 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import re
 import sqlite3
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from functools import partial
 from pathlib import Path
 from typing import Any, Literal
 
-from fastapi import Depends, FastAPI, Header, HTTPException, status
+import anyio.from_thread
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, status
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from calt.core import Run, SafetyProfile, Session, SessionMode, WorkflowStatus, transition_run
 from calt.daemon.docker_env import is_running_in_docker
 from calt.runtime import StepExecutor, StepRunResult
-from calt.storage import connect_sqlite, initialize_storage
+from calt.storage import (
+    SQLiteConnectionPool,
+    connect_sqlite,
+    initialize_storage,
+)
 
 DEFAULT_TOOLS: tuple[tuple[str, str, str], ...] = (
     ("read_file", "workspace_read", "Read a file from session workspace."),
@@ -24,6 +36,125 @@ DEFAULT_TOOLS: tuple[tuple[str, str, str], ...] = (
     ("apply_patch", "workspace_patch", "Apply patch in preview/apply mode."),
 )
 
+_SEED_DEFAULT_TOOLS_SQL = (
+    "INSERT INTO tool_registry (tool_name, permission_profile, description, enabled) VALUES "
+    + ", ".join(["(?, ?, ?, 1)"] * len(DEFAULT_TOOLS))
+    + " ON CONFLICT(tool_name) DO NOTHING"
+)
+_SEED_DEFAULT_TOOLS_PARAMS: tuple[str, ...] = tuple(
+    value for tool in DEFAULT_TOOLS for value in tool
+)
+_CONNECTION_POOL_SIZE = 4
+_READ_CONNECTION_POOL_SIZE = 8
+_CONNECTION_ACQUIRE_TIMEOUT_SEC = 5.0
+_API_PATH_PREFIX = "/api/"
+_BEARER_PREFIX = b"Bearer "
+_BEARER_PREFIX_LENGTH = len(_BEARER_PREFIX)
+_DEFAULT_PAGE_LIMIT = 100
+_MAX_PAGE_LIMIT = 500
+
+_SELECT_SESSION_SQL = """
+SELECT id, goal, mode, safety_profile, status, created_at, updated_at
+FROM sessions
+WHERE id = ?
+"""
+
+_SELECT_SESSION_WITH_PLAN_VERSION_SQL = """
+SELECT
+    s.id,
+    s.goal,
+    s.mode,
+    s.safety_profile,
+    s.status,
+    s.created_at,
+    s.updated_at,
+    (SELECT MAX(p.version) FROM plans AS p WHERE p.session_id = s.id) AS current_plan_version
+FROM sessions AS s
+WHERE s.id = ?
+"""
+
+_SELECT_PLAN_SQL = """
+SELECT id, session_id, version, title
+FROM plans
+WHERE session_id = ? AND version = ?
+"""
+
+_SELECT_STEP_SQL = """
+SELECT
+    s.id,
+    s.step_key,
+    s.title,
+    s.tool_name,
+    s.status,
+    s.risk,
+    s.payload_json,
+    p.id AS plan_id,
+    p.version AS plan_version
+FROM steps AS s
+INNER JOIN plans AS p ON p.id = s.plan_id
+WHERE p.session_id = ? AND s.step_key = ?
+"""
+
+_INSERT_EVENT_SQL = """
+INSERT INTO events (session_id, run_id, event_type, summary, payload_text, source, user_id)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SELECT_APPROVALS_SQL = """
+SELECT
+    COALESCE(
+        MAX(CASE WHEN approval_type = 'plan' AND plan_id = ? THEN 1 ELSE 0 END),
+        0
+    ) AS plan_approved,
+    COALESCE(
+        MAX(CASE WHEN approval_type = 'step' AND step_id = ? THEN 1 ELSE 0 END),
+        0
+    ) AS step_approved
+FROM approvals
+WHERE session_id = ?
+  AND approved = 1
+"""
+
+_COUNT_REMAINING_STEPS_SQL = """
+SELECT COUNT(*) AS remaining_count
+FROM steps
+WHERE plan_id = ?
+  AND status != ?
+"""
+
+_EVENT_SEARCH_COLUMNS = "id, event_type, summary, payload_text, source, user_id, created_at"
+_FTS_SEARCH_EVENTS_SQL = f"""
+SELECT {_EVENT_SEARCH_COLUMNS}
+FROM events
+WHERE session_id = ?
+  AND (
+    id IN (SELECT rowid FROM events_fts WHERE events_fts MATCH ?)
+    OR event_type LIKE ?
+  )
+  AND (? IS NULL OR id < ?)
+ORDER BY id DESC
+LIMIT ?
+"""
+_LIKE_SEARCH_EVENTS_SQL = f"""
+SELECT {_EVENT_SEARCH_COLUMNS}
+FROM events
+WHERE session_id = ?
+  AND (summary LIKE ? OR payload_text LIKE ? OR event_type LIKE ?)
+  AND (? IS NULL OR id < ?)
+ORDER BY id DESC
+LIMIT ?
+"""
+_LIST_EVENTS_SQL = f"""
+SELECT {_EVENT_SEARCH_COLUMNS}
+FROM events
+WHERE session_id = ?
+  AND (? IS NULL OR id < ?)
+ORDER BY id DESC
+LIMIT ?
+"""
+_FTS_QUERY_ERROR_MARKERS = ("fts5: syntax error", "unterminated string", "no such column")
+_ARTIFACT_POOL_WORKERS = 4
+
 
 class CreateSessionRequest(BaseModel):
     goal: str | None = None
@@ -56,46 +187,87 @@ class ExecuteStepRequest(BaseModel):
     confirm_high_risk: bool = False
 
 
-def _require_bearer_token(
-    authorization: str | None = Header(default=None),
-) -> str:
-    if authorization is None or not authorization.startswith("Bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="authorization header with bearer token is required",
-        )
-    token = authorization.split(" ", maxsplit=1)[1].strip()
-    if not token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="authorization header with bearer token is required",
-        )
-    return token
+def _has_bearer_token(headers: list[tuple[bytes, bytes]]) -> bool:
+    for name, value in headers:
+        if name == b"authorization":
+            return (
+                value[:_BEARER_PREFIX_LENGTH] == _BEARER_PREFIX
+                and bool(value[_BEARER_PREFIX_LENGTH:].strip())
+            )
+    return False
+
+
+class _BearerAuthMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["path"].startswith(_API_PATH_PREFIX)
+            and not _has_bearer_token(scope["headers"])
+        ):
+            response = JSONResponse(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                content={"detail": "authorization header with bearer token is required"},
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+@contextmanager
+def _pooled_connection(pool: SQLiteConnectionPool) -> Iterator[sqlite3.Connection]:
+    # Waiting without a bound pins threadpool tokens that the requests holding the
+    # connections need in order to finish, so a saturated pool answers 503 instead.
+    with ExitStack() as stack:
+        try:
+            connection = stack.enter_context(
+                pool.connection(timeout=_CONNECTION_ACQUIRE_TIMEOUT_SEC)
+            )
+        except TimeoutError as error:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="database connections are busy, retry later",
+            ) from error
+        yield connection
+
+
+def _get_connection(request: Request) -> Iterator[sqlite3.Connection]:
+    with _pooled_connection(request.app.state.connection_pool) as connection:
+        yield connection
+
+
+def _get_read_connection(request: Request) -> Iterator[sqlite3.Connection]:
+    with _pooled_connection(request.app.state.read_connection_pool) as connection:
+        yield connection
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        app.state.step_executor.close()
+        app.state.artifact_pool.shutdown(wait=True)
+        app.state.read_connection_pool.close()
+        app.state.connection_pool.close()
 
 
 def _ensure_default_tools(connection: sqlite3.Connection) -> None:
-    connection.executemany(
-        """
-        INSERT INTO tool_registry (tool_name, permission_profile, description, enabled)
-        VALUES (?, ?, ?, 1)
-        ON CONFLICT(tool_name) DO NOTHING
-        """,
-        DEFAULT_TOOLS,
-    )
+    connection.execute(_SEED_DEFAULT_TOOLS_SQL, _SEED_DEFAULT_TOOLS_PARAMS)
+
+
+def _begin_write(connection: sqlite3.Connection) -> None:
+    if not connection.in_transaction:
+        connection.execute("BEGIN IMMEDIATE")
 
 
 def _fetch_session_or_404(
     connection: sqlite3.Connection,
     session_id: str,
 ) -> sqlite3.Row:
-    row = connection.execute(
-        """
-        SELECT id, goal, mode, safety_profile, status, created_at, updated_at
-        FROM sessions
-        WHERE id = ?
-        """,
-        (session_id,),
-    ).fetchone()
+    row = connection.execute(_SELECT_SESSION_SQL, (session_id,)).fetchone()
     if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -109,14 +281,7 @@ def _fetch_plan_or_404(
     session_id: str,
     version: int,
 ) -> sqlite3.Row:
-    row = connection.execute(
-        """
-        SELECT id, session_id, version, title
-        FROM plans
-        WHERE session_id = ? AND version = ?
-        """,
-        (session_id, version),
-    ).fetchone()
+    row = connection.execute(_SELECT_PLAN_SQL, (session_id, version)).fetchone()
     if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -130,24 +295,7 @@ def _fetch_step_or_404(
     session_id: str,
     step_id: str,
 ) -> sqlite3.Row:
-    row = connection.execute(
-        """
-        SELECT
-            s.id,
-            s.step_key,
-            s.title,
-            s.tool_name,
-            s.status,
-            s.risk,
-            s.payload_json,
-            p.id AS plan_id,
-            p.version AS plan_version
-        FROM steps AS s
-        INNER JOIN plans AS p ON p.id = s.plan_id
-        WHERE p.session_id = ? AND s.step_key = ?
-        """,
-        (session_id, step_id),
-    ).fetchone()
+    row = connection.execute(_SELECT_STEP_SQL, (session_id, step_id)).fetchone()
     if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -168,14 +316,17 @@ def _insert_event(
     user_id: str | None = None,
 ) -> None:
     connection.execute(
-        """
-        INSERT INTO events (session_id, run_id, event_type, summary, payload_text, source, user_id)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
+        _INSERT_EVENT_SQL,
         (session_id, run_id, event_type, summary, payload_text, source, user_id),
     )
 
 
+def _fts_phrase(query: str) -> str:
+    # Free text such as "memo.txt" or "step-1" is not valid FTS5 syntax; searching it
+    # as one quoted phrase keeps the tokens and their order without parse errors.
+    return '"' + query.replace('"', '""') + '"'
+
+
 def _parse_step_payload(payload_json: str | None) -> tuple[dict[str, Any], int]:
     default_timeout = 30
     if not payload_json:
@@ -351,6 +502,21 @@ def _serialize_step_row(row: sqlite3.Row) -> dict[str, Any]:
     }
 
 
+def _serialize_tool_row(row: sqlite3.Row) -> dict[str, Any]:
+    return {
+        "tool_name": row["tool_name"],
+        "permission_profile": row["permission_profile"],
+        "description": row["description"],
+        "enabled": bool(row["enabled"]),
+    }
+
+
+def _next_page_cursor(items: list[dict[str, Any]], *, limit: int) -> int | None:
+    if len(items) < limit:
+        return None
+    return items[-1]["id"]
+
+
 def _ensure_session_paths(data_root: Path, session_id: str) -> tuple[Path, Path]:
     workspace_root = data_root / "sessions" / session_id / "workspace"
     artifacts_root = data_root / "sessions" / session_id / "artifacts"
@@ -367,6 +533,36 @@ def _safe_artifact_name(name: str, *, fallback: str) -> str:
     return normalized or fallback
 
 
+def _write_artifact_file(path: Path, data: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        getattr(os, "fdatasync", os.fsync)(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_directory(path: Path) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _store_artifact(path: Path, payload: bytes) -> str:
+    _write_artifact_file(path, payload + b"\n")
+    return hashlib.sha256(payload).hexdigest()
+
+
 def _to_relative_artifact_path(path: Path, root: Path) -> str:
     try:
         return path.resolve().relative_to(root.resolve()).as_posix()
@@ -482,57 +678,74 @@ def create_app(
     bootstrap_connection = connect_sqlite(database_path)
     try:
         initialize_storage(bootstrap_connection)
+        _begin_write(bootstrap_connection)
         _ensure_default_tools(bootstrap_connection)
         bootstrap_connection.commit()
     finally:
         bootstrap_connection.close()
 
-    app = FastAPI(title="calt-daemon")
+    app = FastAPI(title="calt-daemon", lifespan=_lifespan)
+    app.add_middleware(_BearerAuthMiddleware)
+    app.state.connection_pool = SQLiteConnectionPool(
+        database_path,
+        size=_CONNECTION_POOL_SIZE,
+    )
+    app.state.read_connection_pool = SQLiteConnectionPool(
+        database_path,
+        size=_READ_CONNECTION_POOL_SIZE,
+        read_only=True,
+    )
+    app.state.artifact_pool = ThreadPoolExecutor(
+        max_workers=_ARTIFACT_POOL_WORKERS,
+        thread_name_prefix="calt-artifact",
+    )
+    app.state.step_executor = step_executor
 
     @app.post("/api/v1/sessions")
     def create_session(
         payload: CreateSessionRequest,
-        _: str = Depends(_require_bearer_token),
+        connection: sqlite3.Connection = Depends(_get_connection),
     ) -> dict[str, Any]:
         session = Session(
             goal=payload.goal,
             mode=payload.mode,
             safety_profile=payload.safety_profile,
         )
-        connection = connect_sqlite(database_path)
-        try:
-            connection.execute(
-                """
-                INSERT INTO sessions (id, goal, mode, safety_profile, status, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    session.id,
-                    session.goal or "",
-                    session.mode.value,
-                    session.safety_profile.value,
-                    session.status.value,
-                    session.created_at.isoformat(),
-                    session.updated_at.isoformat(),
-                ),
-            )
-            _insert_event(
-                connection,
-                session_id=session.id,
-                event_type="session_created",
-                summary="session created",
-                payload_text=json.dumps(
-                    {
-                        "mode": session.mode.value,
-                        "safety_profile": session.safety_profile.value,
-                    },
-                    ensure_ascii=True,
-                ),
-            )
-            _ensure_session_paths(data_root_path, session.id)
-            connection.commit()
-        finally:
-            connection.close()
+        created_at = session.created_at.isoformat()
+        updated_at = session.updated_at.isoformat()
+        session_created_payload = json.dumps(
+            {
+                "mode": session.mode.value,
+                "safety_profile": session.safety_profile.value,
+            },
+            ensure_ascii=True,
+        )
+        _ensure_session_paths(data_root_path, session.id)
+
+        _begin_write(connection)
+        connection.execute(
+            """
+            INSERT INTO sessions (id, goal, mode, safety_profile, status, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                session.id,
+                session.goal or "",
+                session.mode.value,
+                session.safety_profile.value,
+                session.status.value,
+                created_at,
+                updated_at,
+            ),
+        )
+        _insert_event(
+            connection,
+            session_id=session.id,
+            event_type="session_created",
+            summary="session created",
+            payload_text=session_created_payload,
+        )
+        connection.commit()
 
         return {
             "id": session.id,
@@ -541,28 +754,24 @@ def create_app(
             "safety_profile": session.safety_profile.value,
             "status": session.status.value,
             "plan_version": session.plan_version,
-            "created_at": session.created_at.isoformat(),
-            "updated_at": session.updated_at.isoformat(),
+            "created_at": created_at,
+            "updated_at": updated_at,
         }
 
     @app.get("/api/v1/sessions/{session_id}")
     def get_session(
         session_id: str,
-        _: str = Depends(_require_bearer_token),
+        connection: sqlite3.Connection = Depends(_get_read_connection),
     ) -> dict[str, Any]:
-        connection = connect_sqlite(database_path)
-        try:
-            row = _fetch_session_or_404(connection, session_id)
-            version_row = connection.execute(
-                """
-                SELECT MAX(version) AS current_plan_version
-                FROM plans
-                WHERE session_id = ?
-                """,
-                (session_id,),
-            ).fetchone()
-        finally:
-            connection.close()
+        row = connection.execute(
+            _SELECT_SESSION_WITH_PLAN_VERSION_SQL,
+            (session_id,),
+        ).fetchone()
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="session not found",
+            )
 
         return {
             "id": row["id"],
@@ -571,7 +780,7 @@ def create_app(
             "safety_profile": row["safety_profile"] or SafetyProfile.strict.value,
             "status": row["status"],
             "needs_replan": row["status"] == WorkflowStatus.failed.value,
-            "plan_version": version_row["current_plan_version"],
+            "plan_version": row["current_plan_version"],
             "created_at": row["created_at"],
             "updated_at": row["updated_at"],
         }
@@ -580,102 +789,54 @@ def create_app(
     def import_plan(
         session_id: str,
         payload: PlanImportRequest,
-        _: str = Depends(_require_bearer_token),
+        connection: sqlite3.Connection = Depends(_get_connection),
     ) -> dict[str, Any]:
-        connection = connect_sqlite(database_path)
-        try:
-            _fetch_session_or_404(connection, session_id)
-            connection.execute(
-                """
-                INSERT INTO plans (session_id, version, title, raw_yaml)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(session_id, version) DO UPDATE SET
-                    title = excluded.title,
-                    raw_yaml = excluded.raw_yaml
-                """,
-                (
-                    session_id,
-                    payload.version,
-                    payload.title,
-                    json.dumps(payload.model_dump(), ensure_ascii=True),
-                ),
-            )
-            plan_row = _fetch_plan_or_404(connection, session_id, payload.version)
-            connection.execute(
-                "DELETE FROM steps WHERE plan_id = ?",
-                (plan_row["id"],),
-            )
-
-            for step in payload.steps:
-                connection.execute(
-                    """
-                    INSERT INTO steps (
-                        plan_id,
-                        step_key,
-                        title,
-                        tool_name,
-                        status,
-                        risk,
-                        payload_json
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        plan_row["id"],
-                        step.id,
-                        step.title,
-                        step.tool,
-                        WorkflowStatus.pending.value,
-                        step.risk,
-                        json.dumps(
-                            {
-                                "inputs": step.inputs,
-                                "timeout_sec": step.timeout_sec,
-                            },
-                            ensure_ascii=True,
-                        ),
-                    ),
-                )
+        raw_plan = payload.model_dump_json()
+        _begin_write(connection)
+        _fetch_session_or_404(connection, session_id)
+        plan_row = connection.execute(
+            """
+            INSERT INTO plans (session_id, version, title, raw_yaml)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(session_id, version) DO UPDATE SET
+                title = excluded.title,
+                raw_yaml = excluded.raw_yaml
+            RETURNING id, session_id, version, title
+            """,
+            (
+                session_id,
+                payload.version,
+                payload.title,
+                raw_plan,
+            ),
+        ).fetchone()
+        plan_id = plan_row["id"]
+        connection.execute(
+            "DELETE FROM steps WHERE plan_id = ?",
+            (plan_id,),
+        )
 
-            if payload.session_goal is None:
-                connection.execute(
-                    """
-                    UPDATE sessions
-                    SET status = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                    """,
-                    (WorkflowStatus.awaiting_plan_approval.value, session_id),
-                )
-            else:
-                connection.execute(
-                    """
-                    UPDATE sessions
-                    SET goal = ?, status = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                    """,
-                    (
-                        payload.session_goal,
-                        WorkflowStatus.awaiting_plan_approval.value,
-                        session_id,
+        step_rows: list[tuple[int, str, str, str, str, str, str]] = []
+        response_steps: list[dict[str, Any]] = []
+        for step in payload.steps:
+            step_rows.append(
+                (
+                    plan_id,
+                    step.id,
+                    step.title,
+                    step.tool,
+                    WorkflowStatus.pending.value,
+                    step.risk,
+                    json.dumps(
+                        {
+                            "inputs": step.inputs,
+                            "timeout_sec": step.timeout_sec,
+                        },
+                        ensure_ascii=True,
                     ),
                 )
-
-            _insert_event(
-                connection,
-                session_id=session_id,
-                event_type="plan_imported",
-                summary=f"plan v{payload.version} imported",
-                payload_text=payload.title,
             )
-            connection.commit()
-        finally:
-            connection.close()
-
-        return {
-            "session_id": session_id,
-            "version": payload.version,
-            "title": payload.title,
-            "steps": [
+            response_steps.append(
                 {
                     "id": step.id,
                     "title": step.title,
@@ -685,37 +846,75 @@ def create_app(
                     "inputs": step.inputs,
                     "timeout_sec": step.timeout_sec,
                 }
-                for step in payload.steps
-            ],
+            )
+        connection.executemany(
+            """
+            INSERT INTO steps (
+                plan_id,
+                step_key,
+                title,
+                tool_name,
+                status,
+                risk,
+                payload_json
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            step_rows,
+        )
+
+        connection.execute(
+            """
+            UPDATE sessions
+            SET goal = COALESCE(?, goal), status = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+            """,
+            (
+                payload.session_goal,
+                WorkflowStatus.awaiting_plan_approval.value,
+                session_id,
+            ),
+        )
+
+        _insert_event(
+            connection,
+            session_id=session_id,
+            event_type="plan_imported",
+            summary=f"plan v{payload.version} imported",
+            payload_text=payload.title,
+        )
+        connection.commit()
+
+        return {
+            "session_id": plan_row["session_id"],
+            "version": plan_row["version"],
+            "title": plan_row["title"],
+            "steps": response_steps,
         }
 
     @app.get("/api/v1/sessions/{session_id}/plans/{version}")
     def get_plan(
         session_id: str,
         version: int,
-        _: str = Depends(_require_bearer_token),
+        connection: sqlite3.Connection = Depends(_get_read_connection),
     ) -> dict[str, Any]:
-        connection = connect_sqlite(database_path)
-        try:
-            _fetch_session_or_404(connection, session_id)
-            plan_row = _fetch_plan_or_404(connection, session_id, version)
-            step_rows = connection.execute(
-                """
-                SELECT step_key, title, tool_name, risk, status, payload_json
-                FROM steps
-                WHERE plan_id = ?
-                ORDER BY id
-                """,
-                (plan_row["id"],),
-            ).fetchall()
-        finally:
-            connection.close()
+        _fetch_session_or_404(connection, session_id)
+        plan_row = _fetch_plan_or_404(connection, session_id, version)
+        step_cursor = connection.execute(
+            """
+            SELECT step_key, title, tool_name, risk, status, payload_json
+            FROM steps
+            WHERE plan_id = ?
+            ORDER BY id
+            """,
+            (plan_row["id"],),
+        )
 
         return {
             "session_id": session_id,
             "version": plan_row["version"],
             "title": plan_row["title"],
-            "steps": [_serialize_step_row(row) for row in step_rows],
+            "steps": list(map(_serialize_step_row, step_cursor)),
         }
 
     @app.post("/api/v1/sessions/{session_id}/plans/{version}/approve")
@@ -723,38 +922,35 @@ def create_app(
         session_id: str,
         version: int,
         payload: ApprovalRequest,
-        _: str = Depends(_require_bearer_token),
+        connection: sqlite3.Connection = Depends(_get_connection),
     ) -> dict[str, Any]:
-        connection = connect_sqlite(database_path)
-        try:
-            _fetch_session_or_404(connection, session_id)
-            plan_row = _fetch_plan_or_404(connection, session_id, version)
-            connection.execute(
-                """
-                INSERT INTO approvals (session_id, plan_id, approval_type, approved, source, user_id)
-                VALUES (?, ?, 'plan', 1, ?, ?)
-                """,
-                (session_id, plan_row["id"], payload.source, payload.approved_by),
-            )
-            connection.execute(
-                """
-                UPDATE sessions
-                SET status = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-                """,
-                (WorkflowStatus.awaiting_step_approval.value, session_id),
-            )
-            _insert_event(
-                connection,
-                session_id=session_id,
-                event_type="plan_approved",
-                summary=f"plan v{version} approved",
-                source=payload.source,
-                user_id=payload.approved_by,
-            )
-            connection.commit()
-        finally:
-            connection.close()
+        _begin_write(connection)
+        _fetch_session_or_404(connection, session_id)
+        plan_row = _fetch_plan_or_404(connection, session_id, version)
+        connection.execute(
+            """
+            INSERT INTO approvals (session_id, plan_id, approval_type, approved, source, user_id)
+            VALUES (?, ?, 'plan', 1, ?, ?)
+            """,
+            (session_id, plan_row["id"], payload.source, payload.approved_by),
+        )
+        connection.execute(
+            """
+            UPDATE sessions
+            SET status = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+            """,
+            (WorkflowStatus.awaiting_step_approval.value, session_id),
+        )
+        _insert_event(
+            connection,
+            session_id=session_id,
+            event_type="plan_approved",
+            summary=f"plan v{version} approved",
+            source=payload.source,
+            user_id=payload.approved_by,
+        )
+        connection.commit()
 
         return {
             "session_id": session_id,
@@ -767,52 +963,49 @@ def create_app(
         session_id: str,
         step_id: str,
         payload: ApprovalRequest,
-        _: str = Depends(_require_bearer_token),
+        connection: sqlite3.Connection = Depends(_get_connection),
     ) -> dict[str, Any]:
-        connection = connect_sqlite(database_path)
-        try:
-            _fetch_session_or_404(connection, session_id)
-            step_row = _fetch_step_or_404(connection, session_id, step_id)
-            connection.execute(
-                """
-                INSERT INTO approvals (
-                    session_id,
-                    plan_id,
-                    step_id,
-                    approval_type,
-                    approved,
-                    source,
-                    user_id
-                )
-                VALUES (?, ?, ?, 'step', 1, ?, ?)
-                """,
-                (
-                    session_id,
-                    step_row["plan_id"],
-                    step_row["id"],
-                    payload.source,
-                    payload.approved_by,
-                ),
-            )
-            connection.execute(
-                """
-                UPDATE steps
-                SET status = ?
-                WHERE id = ?
-                """,
-                (WorkflowStatus.awaiting_step_approval.value, step_row["id"]),
-            )
-            _insert_event(
-                connection,
-                session_id=session_id,
-                event_type="step_approved",
-                summary=f"step {step_id} approved",
-                source=payload.source,
-                user_id=payload.approved_by,
+        _begin_write(connection)
+        _fetch_session_or_404(connection, session_id)
+        step_row = _fetch_step_or_404(connection, session_id, step_id)
+        connection.execute(
+            """
+            INSERT INTO approvals (
+                session_id,
+                plan_id,
+                step_id,
+                approval_type,
+                approved,
+                source,
+                user_id
             )
-            connection.commit()
-        finally:
-            connection.close()
+            VALUES (?, ?, ?, 'step', 1, ?, ?)
+            """,
+            (
+                session_id,
+                step_row["plan_id"],
+                step_row["id"],
+                payload.source,
+                payload.approved_by,
+            ),
+        )
+        connection.execute(
+            """
+            UPDATE steps
+            SET status = ?
+            WHERE id = ?
+            """,
+            (WorkflowStatus.awaiting_step_approval.value, step_row["id"]),
+        )
+        _insert_event(
+            connection,
+            session_id=session_id,
+            event_type="step_approved",
+            summary=f"step {step_id} approved",
+            source=payload.source,
+            user_id=payload.approved_by,
+        )
+        connection.commit()
 
         return {
             "session_id": session_id,
@@ -825,10 +1018,8 @@ def create_app(
         session_id: str,
         step_id: str,
         payload: ExecuteStepRequest | None = None,
-        _: str = Depends(_require_bearer_token),
     ) -> dict[str, Any]:
-        connection = connect_sqlite(database_path)
-        try:
+        with _pooled_connection(app.state.connection_pool) as connection:
             session_row = _fetch_session_or_404(connection, session_id)
             if session_row["status"] == WorkflowStatus.failed.value:
                 raise HTTPException(
@@ -845,32 +1036,12 @@ def create_app(
                 )
             step_row = _fetch_step_or_404(connection, session_id, step_id)
 
-            plan_approved = connection.execute(
-                """
-                SELECT 1
-                FROM approvals
-                WHERE session_id = ?
-                  AND plan_id = ?
-                  AND approval_type = 'plan'
-                  AND approved = 1
-                LIMIT 1
-                """,
-                (session_id, step_row["plan_id"]),
-            ).fetchone()
-            step_approved = connection.execute(
-                """
-                SELECT 1
-                FROM approvals
-                WHERE session_id = ?
-                  AND step_id = ?
-                  AND approval_type = 'step'
-                  AND approved = 1
-                LIMIT 1
-                """,
-                (session_id, step_row["id"]),
+            approval_row = connection.execute(
+                _SELECT_APPROVALS_SQL,
+                (step_row["plan_id"], step_row["id"], session_id),
             ).fetchone()
 
-            if plan_approved is None or step_approved is None:
+            if not approval_row["plan_approved"] or not approval_row["step_approved"]:
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT,
                     detail="plan and step approvals are required before execution",
@@ -891,6 +1062,7 @@ def create_app(
                 )
             except StepInputReferenceResolutionError as error:
                 detail = str(error)
+                _begin_write(connection)
                 _insert_event(
                     connection,
                     session_id=session_id,
@@ -927,6 +1099,7 @@ def create_app(
                 and not confirm_high_risk
             ):
                 detail = "high-risk step requires confirm_high_risk=true"
+                _begin_write(connection)
                 _insert_event(
                     connection,
                     session_id=session_id,
@@ -954,6 +1127,7 @@ def create_app(
             )
             if session_mode == SessionMode.dry_run.value and is_destructive_apply:
                 detail = "dry_run session rejects destructive apply operations"
+                _begin_write(connection)
                 _insert_event(
                     connection,
                     session_id=session_id,
@@ -986,6 +1160,7 @@ def create_app(
                         "docker required: strict profile rejects destructive apply "
                         "operations outside docker"
                     )
+                    _begin_write(connection)
                     _insert_event(
                         connection,
                         session_id=session_id,
@@ -1011,6 +1186,7 @@ def create_app(
                         detail=detail,
                     )
                 if session_safety_profile == SafetyProfile.dev.value and not docker_environment:
+                    _begin_write(connection)
                     _insert_event(
                         connection,
                         session_id=session_id,
@@ -1030,6 +1206,7 @@ def create_app(
                             ensure_ascii=True,
                         ),
                     )
+                    connection.commit()
 
             run = Run(
                 session_id=session_id,
@@ -1049,29 +1226,36 @@ def create_app(
                 )
             else:
                 gate_error = None
-            if gate_error is None:
-                runtime_result = step_executor.execute(
+        if gate_error is None:
+            runtime_result = anyio.from_thread.run(
+                partial(
+                    step_executor.execute,
                     tool=step_row["tool_name"],
                     inputs=runtime_inputs,
                     timeout=timeout_sec,
                 )
-            else:
-                runtime_result = StepRunResult(status="failed", error=gate_error)
-            if runtime_result.status == "succeeded":
-                transition_run(run, WorkflowStatus.succeeded)
-                step_status = WorkflowStatus.succeeded
-            else:
-                transition_run(
-                    run,
-                    WorkflowStatus.failed,
-                    failure_reason=runtime_result.error or "tool_failed",
-                )
-                step_status = WorkflowStatus.failed
+            )
+        else:
+            runtime_result = StepRunResult(status="failed", error=gate_error)
+        if runtime_result.status == "succeeded":
+            transition_run(run, WorkflowStatus.succeeded)
+            step_status = WorkflowStatus.succeeded
+        else:
+            transition_run(
+                run,
+                WorkflowStatus.failed,
+                failure_reason=runtime_result.error or "tool_failed",
+            )
+            step_status = WorkflowStatus.failed
 
-            duration_ms: int | None = None
-            if run.started_at is not None and run.finished_at is not None:
-                duration_ms = int((run.finished_at - run.started_at).total_seconds() * 1000)
+        duration_ms: int | None = None
+        if run.started_at is not None and run.finished_at is not None:
+            duration_ms = int((run.finished_at - run.started_at).total_seconds() * 1000)
+        started_at = run.started_at.isoformat() if run.started_at else None
+        finished_at = run.finished_at.isoformat() if run.finished_at else None
 
+        with _pooled_connection(app.state.connection_pool) as connection:
+            _begin_write(connection)
             run_cursor = connection.execute(
                 """
                 INSERT INTO runs (
@@ -1095,46 +1279,60 @@ def create_app(
                     run.status.value,
                     duration_ms,
                     run.failure_reason,
-                    run.started_at.isoformat() if run.started_at else None,
-                    run.finished_at.isoformat() if run.finished_at else None,
+                    started_at,
+                    finished_at,
                 ),
             )
             run_id = run_cursor.lastrowid
 
-            saved_artifacts: list[str] = []
+            artifact_pool: ThreadPoolExecutor = app.state.artifact_pool
+            pending_artifacts: list[tuple[str, Path, Future[str]]] = []
             for index, artifact in enumerate(runtime_result.artifacts, start=1):
-                artifact_payload = json.dumps(
-                    artifact.payload,
-                    ensure_ascii=True,
-                    indent=2,
-                    sort_keys=True,
-                )
                 safe_name = _safe_artifact_name(
                     artifact.name,
                     fallback=f"artifact_{index}.json",
                 )
                 artifact_file = artifacts_root / f"run_{run_id}_{index}_{safe_name}"
-                artifact_file.write_text(f"{artifact_payload}\n", encoding="utf-8")
-                sha256 = hashlib.sha256(artifact_payload.encode("utf-8")).hexdigest()
+                pending_artifacts.append(
+                    (
+                        artifact.kind,
+                        artifact_file,
+                        artifact_pool.submit(_store_artifact, artifact_file, artifact.payload),
+                    )
+                )
+            # Every write must settle before any is reported, so a failure can remove the
+            # files its siblings already wrote instead of leaving them orphaned on disk.
+            wait([future for _, _, future in pending_artifacts])
+            write_failure: BaseException | None = None
+            for _, _, future in pending_artifacts:
+                write_failure = future.exception()
+                if write_failure is not None:
+                    break
+            if write_failure is not None:
+                for _, artifact_file, _ in pending_artifacts:
+                    artifact_file.unlink(missing_ok=True)
+                raise write_failure
+
+            saved_artifacts: list[str] = []
+            artifact_rows: list[tuple[str, int | None, int, str, str, str]] = []
+            for kind, artifact_file, future in pending_artifacts:
+                sha256 = future.result()
                 artifact_path = _to_relative_artifact_path(
                     artifact_file,
                     root=project_root_path,
                 )
-                connection.execute(
+                artifact_rows.append(
+                    (session_id, run_id, step_row["id"], kind, artifact_path, sha256)
+                )
+                saved_artifacts.append(artifact_path)
+            if artifact_rows:
+                connection.executemany(
                     """
                     INSERT INTO artifacts (session_id, run_id, step_id, kind, path, sha256)
                     VALUES (?, ?, ?, ?, ?, ?)
                     """,
-                    (
-                        session_id,
-                        run_id,
-                        step_row["id"],
-                        artifact.kind,
-                        artifact_path,
-                        sha256,
-                    ),
+                    artifact_rows,
                 )
-                saved_artifacts.append(artifact_path)
 
             connection.execute(
                 """
@@ -1149,12 +1347,7 @@ def create_app(
                 session_status = WorkflowStatus.failed
             else:
                 remaining_steps_row = connection.execute(
-                    """
-                    SELECT COUNT(*) AS remaining_count
-                    FROM steps
-                    WHERE plan_id = ?
-                      AND status != ?
-                    """,
+                    _COUNT_REMAINING_STEPS_SQL,
                     (step_row["plan_id"], WorkflowStatus.succeeded.value),
                 ).fetchone()
                 all_steps_succeeded = remaining_steps_row["remaining_count"] == 0
@@ -1172,79 +1365,73 @@ def create_app(
                 (session_status.value, session_id),
             )
 
-            _insert_event(
-                connection,
-                session_id=session_id,
-                run_id=run_id,
-                event_type=(
-                    "step_executed"
-                    if step_status == WorkflowStatus.succeeded
-                    else "step_failed"
-                ),
-                summary=(
-                    f"step {step_id} executed"
-                    if step_status == WorkflowStatus.succeeded
-                    else f"step {step_id} failed"
-                ),
-                payload_text=json.dumps(
-                    {
-                        "tool": step_row["tool_name"],
-                        "safety_profile": session_safety_profile,
-                        "runtime_status": runtime_result.status,
-                        "output": runtime_result.output,
-                        "error": runtime_result.error,
-                        "artifacts": saved_artifacts,
-                    },
-                    ensure_ascii=True,
-                ),
+            event_type, summary = (
+                ("step_executed", f"step {step_id} executed")
+                if step_status == WorkflowStatus.succeeded
+                else ("step_failed", f"step {step_id} failed")
             )
-            for artifact_path in saved_artifacts:
-                _insert_event(
-                    connection,
-                    session_id=session_id,
-                    run_id=run_id,
-                    event_type="artifact_saved",
-                    summary=f"artifact saved: {artifact_path}",
-                    payload_text=artifact_path,
+            payload_text = json.dumps(
+                {
+                    "tool": step_row["tool_name"],
+                    "safety_profile": session_safety_profile,
+                    "runtime_status": runtime_result.status,
+                    "output": runtime_result.output,
+                    "error": runtime_result.error,
+                    "artifacts": saved_artifacts,
+                },
+                ensure_ascii=True,
+            )
+            event_rows = [(session_id, run_id, event_type, summary, payload_text, "daemon", None)]
+            event_rows.extend(
+                (
+                    session_id,
+                    run_id,
+                    "artifact_saved",
+                    f"artifact saved: {artifact_path}",
+                    artifact_path,
+                    "daemon",
+                    None,
                 )
+                for artifact_path in saved_artifacts
+            )
+            connection.executemany(_INSERT_EVENT_SQL, event_rows)
             connection.commit()
-            return {
-                "session_id": session_id,
-                "step_id": step_id,
-                "status": step_status.value,
-                "run_id": run_id,
-                "output": runtime_result.output,
-                "error": runtime_result.error,
-                "artifacts": saved_artifacts,
-            }
-        finally:
-            connection.close()
+        if saved_artifacts:
+            # The directory entries are flushed after commit so the writer lock is not
+            # held across an fsync; the file contents were already synced by the writers.
+            _fsync_directory(artifacts_root)
+        return {
+            "session_id": session_id,
+            "step_id": step_id,
+            "status": step_status.value,
+            "run_id": run_id,
+            "output": runtime_result.output,
+            "error": runtime_result.error,
+            "artifacts": saved_artifacts,
+        }
 
     @app.post("/api/v1/sessions/{session_id}/stop")
     def stop_session(
         session_id: str,
-        _: str = Depends(_require_bearer_token),
+        connection: sqlite3.Connection = Depends(_get_connection),
     ) -> dict[str, Any]:
-        connection = connect_sqlite(database_path)
-        try:
-            _fetch_session_or_404(connection, session_id)
-            connection.execute(
-                """
-                UPDATE sessions
-                SET status = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-                """,
-                (WorkflowStatus.cancelled.value, session_id),
-            )
-            _insert_event(
-                connection,
-                session_id=session_id,
-                event_type="session_stopped",
-                summary="session stopped",
-            )
-            connection.commit()
-        finally:
-            connection.close()
+        _begin_write(connection)
+        _fetch_session_or_404(connection, session_id)
+        connection.execute(
+            """
+            UPDATE sessions
+            SET status = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+            """,
+            (WorkflowStatus.cancelled.value, session_id),
+        )
+        _insert_event(
+            connection,
+            session_id=session_id,
+            event_type="session_stopped",
+            summary="session stopped",
+        )
+        connection.commit()
 
         return {
             "session_id": session_id,
@@ -1255,152 +1442,98 @@ def create_app(
     def search_events(
         session_id: str,
         q: str | None = None,
-        _: str = Depends(_require_bearer_token),
+        cursor: int | None = None,
+        limit: int = Query(default=_DEFAULT_PAGE_LIMIT, ge=1, le=_MAX_PAGE_LIMIT),
+        connection: sqlite3.Connection = Depends(_get_read_connection),
     ) -> dict[str, Any]:
-        connection = connect_sqlite(database_path)
-        try:
-            _fetch_session_or_404(connection, session_id)
-            if q:
-                like_pattern = f"%{q}%"
-                try:
-                    rows = connection.execute(
-                        """
-                        SELECT
-                            e.id,
-                            e.event_type,
-                            e.summary,
-                            e.payload_text,
-                            e.source,
-                            e.user_id,
-                            e.created_at
-                        FROM events AS e
-                        INNER JOIN events_fts ON events_fts.rowid = e.id
-                        WHERE e.session_id = ?
-                          AND (events_fts MATCH ? OR e.event_type LIKE ?)
-                        ORDER BY e.id DESC
-                        """,
-                        (session_id, q, like_pattern),
-                    ).fetchall()
-                except sqlite3.OperationalError:
-                    rows = connection.execute(
-                        """
-                        SELECT id, event_type, summary, payload_text, source, user_id, created_at
-                        FROM events
-                        WHERE session_id = ?
-                          AND (summary LIKE ? OR payload_text LIKE ? OR event_type LIKE ?)
-                        ORDER BY id DESC
-                        """,
-                        (session_id, like_pattern, like_pattern, like_pattern),
-                    ).fetchall()
-            else:
+        _fetch_session_or_404(connection, session_id)
+        if q:
+            like_pattern = f"%{q}%"
+            try:
                 rows = connection.execute(
-                    """
-                    SELECT id, event_type, summary, payload_text, source, user_id, created_at
-                    FROM events
-                    WHERE session_id = ?
-                    ORDER BY id DESC
-                    LIMIT 100
-                    """,
-                    (session_id,),
-                ).fetchall()
-        finally:
-            connection.close()
+                    _FTS_SEARCH_EVENTS_SQL,
+                    (session_id, _fts_phrase(q), like_pattern, cursor, cursor, limit),
+                )
+            except sqlite3.OperationalError as exc:
+                message = str(exc)
+                if message.startswith(_FTS_QUERY_ERROR_MARKERS):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"invalid search query: {message}",
+                    ) from exc
+                if "no such table" not in message:
+                    raise
+                rows = connection.execute(
+                    _LIKE_SEARCH_EVENTS_SQL,
+                    (
+                        session_id,
+                        like_pattern,
+                        like_pattern,
+                        like_pattern,
+                        cursor,
+                        cursor,
+                        limit,
+                    ),
+                )
+        else:
+            rows = connection.execute(
+                _LIST_EVENTS_SQL,
+                (session_id, cursor, cursor, limit),
+            )
 
-        return {
-            "items": [
-                {
-                    "id": row["id"],
-                    "event_type": row["event_type"],
-                    "summary": row["summary"],
-                    "payload_text": row["payload_text"],
-                    "source": row["source"],
-                    "user_id": row["user_id"],
-                    "created_at": row["created_at"],
-                }
-                for row in rows
-            ]
-        }
+        items = list(map(dict, rows))
+        return {"items": items, "next_cursor": _next_page_cursor(items, limit=limit)}
 
     @app.get("/api/v1/sessions/{session_id}/artifacts")
     def list_artifacts(
         session_id: str,
-        _: str = Depends(_require_bearer_token),
+        cursor: int | None = None,
+        limit: int = Query(default=_DEFAULT_PAGE_LIMIT, ge=1, le=_MAX_PAGE_LIMIT),
+        connection: sqlite3.Connection = Depends(_get_read_connection),
     ) -> dict[str, Any]:
-        connection = connect_sqlite(database_path)
-        try:
-            _fetch_session_or_404(connection, session_id)
-            rows = connection.execute(
-                """
-                SELECT id, run_id, step_id, kind, path, sha256, created_at
-                FROM artifacts
-                WHERE session_id = ?
-                ORDER BY id DESC
-                """,
-                (session_id,),
-            ).fetchall()
-        finally:
-            connection.close()
+        _fetch_session_or_404(connection, session_id)
+        rows = connection.execute(
+            """
+            SELECT id, run_id, step_id, kind, path, sha256, created_at
+            FROM artifacts
+            WHERE session_id = ?
+              AND (? IS NULL OR id < ?)
+            ORDER BY id DESC
+            LIMIT ?
+            """,
+            (session_id, cursor, cursor, limit),
+        )
 
-        return {
-            "items": [
-                {
-                    "id": row["id"],
-                    "run_id": row["run_id"],
-                    "step_id": row["step_id"],
-                    "kind": row["kind"],
-                    "path": row["path"],
-                    "sha256": row["sha256"],
-                    "created_at": row["created_at"],
-                }
-                for row in rows
-            ]
-        }
+        items = list(map(dict, rows))
+        return {"items": items, "next_cursor": _next_page_cursor(items, limit=limit)}
 
     @app.get("/api/v1/tools")
-    def list_tools(_: str = Depends(_require_bearer_token)) -> dict[str, Any]:
-        connection = connect_sqlite(database_path)
-        try:
-            _ensure_default_tools(connection)
-            rows = connection.execute(
-                """
-                SELECT tool_name, permission_profile, description, enabled
-                FROM tool_registry
-                ORDER BY tool_name
-                """
-            ).fetchall()
-            connection.commit()
-        finally:
-            connection.close()
+    def list_tools(
+        connection: sqlite3.Connection = Depends(_get_read_connection),
+    ) -> dict[str, Any]:
+        cursor = connection.execute(
+            """
+            SELECT tool_name, permission_profile, description, enabled
+            FROM tool_registry
+            ORDER BY tool_name
+            """
+        )
 
-        return {
-            "items": [
-                {
-                    "tool_name": row["tool_name"],
-                    "permission_profile": row["permission_profile"],
-                    "description": row["description"],
-                    "enabled": bool(row["enabled"]),
-                }
-                for row in rows
-            ]
-        }
+        return {"items": list(map(_serialize_tool_row, cursor))}
 
     @app.get("/api/v1/tools/{tool_name}/permissions")
     def get_tool_permissions(
         tool_name: str,
-        _: str = Depends(_require_bearer_token),
+        connection: sqlite3.Connection = Depends(_get_read_connection),
     ) -> dict[str, Any]:
-        connection = connect_sqlite(database_path)
-        try:
-            row = connection.execute(
-                """
-                SELECT tool_name, permission_profile, description, enabled
-                FROM tool_registry
-                WHERE tool_name = ?
-                """,
-                (tool_name,),
-            ).fetchone()
-        finally:
-            connection.close()
+        row = connection.execute(
+            """
+            SELECT tool_name, permission_profile, description, enabled
+            FROM tool_registry
+            WHERE tool_name = ?
+            """,
+            (tool_name,),
+        ).fetchone()
 
         if row is None:
             return {
@@ -1409,11 +1542,6 @@ def create_app(
                 "description": "",
                 "enabled": False,
             }
-        return {
-            "tool_name": row["tool_name"],
-            "permission_profile": row["permission_profile"],
-            "description": row["description"],
-            "enabled": bool(row["enabled"]),
-        }
+        return _serialize_tool_row(row)
 
     return app
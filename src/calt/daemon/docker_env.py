@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from pathlib import Path
 
 _CGROUP_DOCKER_MARKERS: tuple[str, ...] = (
@@ -8,8 +10,13 @@ _CGROUP_DOCKER_MARKERS: tuple[str, ...] = (
     "kubepods",
     "podman",
 )
+_CGROUP_DOCKER_MARKER_RE = re.compile(
+    b"|".join(re.escape(marker.encode("ascii")) for marker in _CGROUP_DOCKER_MARKERS),
+    re.IGNORECASE,
+)
 
 
+@lru_cache(maxsize=8)
 def is_running_in_docker(
     *,
     dockerenv_path: str | Path = "/.dockerenv",
@@ -21,9 +28,8 @@ def is_running_in_docker(
 
     cgroup = Path(cgroup_path)
     try:
-        cgroup_text = cgroup.read_text(encoding="utf-8")
+        cgroup_data = cgroup.read_bytes()
     except OSError:
         return False
 
-    lowered = cgroup_text.lower()
-    return any(marker in lowered for marker in _CGROUP_DOCKER_MARKERS)
+    return _CGROUP_DOCKER_MARKER_RE.search(cgroup_data) is not None
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import argparse
+import os
 from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
 import uvicorn
+from fastapi import FastAPI
 
 from .api import create_app
 
+DB_PATH_ENV = "CALT_DAEMON_DB_PATH"
+DATA_ROOT_ENV = "CALT_DAEMON_DATA_ROOT"
+WORKERS_ENV = "WEB_CONCURRENCY"
+LOOP_CHOICES: tuple[str, ...] = ("auto", "asyncio", "uvloop")
+
 
 @dataclass(frozen=True)
 class DaemonSettings:
@@ -17,6 +24,8 @@ class DaemonSettings:
     host: str
     port: int
     reload: bool
+    workers: int = 1
+    loop: str = "auto"
 
 
 def _resolve_path(path: str) -> Path:
@@ -30,6 +39,8 @@ def build_daemon_settings(
     host: str,
     port: int,
     reload: bool,
+    workers: int = 1,
+    loop: str = "auto",
 ) -> DaemonSettings:
     return DaemonSettings(
         db_path=_resolve_path(db_path),
@@ -37,9 +48,18 @@ def build_daemon_settings(
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
+        loop=loop,
     )
 
 
+def _default_workers() -> int:
+    try:
+        return max(1, int(os.environ.get(WORKERS_ENV, "1")))
+    except ValueError:
+        return 1
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="calt-daemon",
@@ -71,6 +91,18 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Enable development auto-reload.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=_default_workers(),
+        help=f"Number of worker processes (default: ${WORKERS_ENV} or 1).",
+    )
+    parser.add_argument(
+        "--loop",
+        choices=LOOP_CHOICES,
+        default="auto",
+        help="Event loop implementation (auto uses uvloop when installed).",
+    )
     return parser
 
 
@@ -83,15 +115,43 @@ def parse_daemon_settings(argv: Sequence[str] | None = None) -> DaemonSettings:
         host=args.host,
         port=args.port,
         reload=args.reload,
+        workers=args.workers,
+        loop=args.loop,
+    )
+
+
+def create_app_from_env() -> FastAPI:
+    data_root = os.environ.get(DATA_ROOT_ENV)
+    return create_app(
+        os.environ[DB_PATH_ENV],
+        data_root=data_root or None,
     )
 
 
 def run(argv: Sequence[str] | None = None) -> None:
     settings = parse_daemon_settings(argv)
+    if settings.workers > 1 or settings.reload:
+        # Worker processes and the reloader re-import the app, so they need a factory path.
+        os.environ[DB_PATH_ENV] = str(settings.db_path)
+        if settings.data_root is not None:
+            os.environ[DATA_ROOT_ENV] = str(settings.data_root)
+        else:
+            os.environ.pop(DATA_ROOT_ENV, None)
+        uvicorn.run(
+            "calt.daemon.entrypoint:create_app_from_env",
+            factory=True,
+            host=settings.host,
+            port=settings.port,
+            reload=settings.reload,
+            workers=None if settings.reload else settings.workers,
+            loop=settings.loop,
+        )
+        return
+
     app = create_app(settings.db_path, data_root=settings.data_root)
     uvicorn.run(
         app,
         host=settings.host,
         port=settings.port,
-        reload=settings.reload,
+        loop=settings.loop,
     )
@@ -1,15 +1,62 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+from pathlib import Path
 from typing import Any, Awaitable, Callable
 
 import discord
+from discord import app_commands
 from discord.ext import commands
 
 from .service import DiscordAuthorizationError, DiscordBotService
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
-def create_bot(service: DiscordBotService) -> commands.Bot:
+# Discord rejects messages over 2000 characters; leave room for the header and code fence.
+MAX_REPLY_BODY_CHARS = 1900
+_TRUNCATION_MARKER = "\n... (truncated)"
+
+COMMAND_HASH_PATH_ENV = "CALT_DISCORD_COMMAND_HASH_PATH"
+# Sits next to the daemon's default database so a checkout keeps one data directory.
+DEFAULT_COMMAND_HASH_PATH = "data/discord_command_hash"
+
+
+def format_reply_body(payload: dict[str, Any]) -> str:
+    if orjson is not None:
+        body = orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+    else:
+        body = json.dumps(payload, ensure_ascii=False, indent=2)
+    if len(body) > MAX_REPLY_BODY_CHARS:
+        body = body[:MAX_REPLY_BODY_CHARS] + _TRUNCATION_MARKER
+    return body
+
+
+def command_tree_hash(tree: app_commands.CommandTree[Any]) -> str:
+    definitions = sorted(
+        (command.to_dict(tree) for command in tree.get_commands()),
+        key=lambda definition: definition["name"],
+    )
+    encoded = json.dumps(definitions, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def resolve_command_hash_path(command_hash_path: str | Path | None = None) -> Path:
+    if command_hash_path is None:
+        command_hash_path = os.environ.get(COMMAND_HASH_PATH_ENV) or DEFAULT_COMMAND_HASH_PATH
+    return Path(command_hash_path).expanduser().resolve()
+
+
+def create_bot(
+    service: DiscordBotService,
+    *,
+    command_hash_path: str | Path | None = None,
+) -> commands.Bot:
+    hash_file = resolve_command_hash_path(command_hash_path)
     bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
 
     async def _send_ephemeral(interaction: discord.Interaction[Any], content: str) -> None:
@@ -22,10 +69,11 @@ def create_bot(service: DiscordBotService) -> commands.Bot:
         interaction: discord.Interaction[Any],
         *,
         command_name: str,
-        operation: Callable[[], Awaitable[dict[str, Any]]],
+        method: Callable[..., Awaitable[dict[str, Any]]],
+        **kwargs: Any,
     ) -> None:
         try:
-            payload = await operation()
+            payload = await method(user_id=interaction.user.id, **kwargs)
         except DiscordAuthorizationError:
             await _send_ephemeral(interaction, "unauthorized user")
             return
@@ -33,19 +81,30 @@ def create_bot(service: DiscordBotService) -> commands.Bot:
             await _send_ephemeral(interaction, f"{command_name} failed: {exc}")
             return
 
-        body = json.dumps(payload, ensure_ascii=False, indent=2)
+        body = format_reply_body(payload)
         await _send_ephemeral(interaction, f"{command_name} ok\n```json\n{body}\n```")
 
     @bot.event
     async def setup_hook() -> None:
+        # Global sync is slow and rate-limited, so skip it when the registered commands
+        # match what was last pushed to Discord.
+        current_hash = command_tree_hash(bot.tree)
+        try:
+            if hash_file.read_text(encoding="utf-8").strip() == current_hash:
+                return
+        except FileNotFoundError:
+            pass
         await bot.tree.sync()
+        hash_file.parent.mkdir(parents=True, exist_ok=True)
+        hash_file.write_text(f"{current_hash}\n", encoding="utf-8")
 
     @bot.tree.command(name="session_create", description="Create a session")
     async def session_create(interaction: discord.Interaction[Any], goal: str | None = None) -> None:
         await _run_command(
             interaction,
             command_name="session_create",
-            operation=lambda: service.session_create(user_id=interaction.user.id, goal=goal),
+            method=service.session_create,
+            goal=goal,
         )
 
     @bot.tree.command(name="plan_show", description="Show imported plan")
@@ -57,11 +116,9 @@ def create_bot(service: DiscordBotService) -> commands.Bot:
         await _run_command(
             interaction,
             command_name="plan_show",
-            operation=lambda: service.plan_show(
-                user_id=interaction.user.id,
-                session_id=session_id,
-                version=version,
-            ),
+            method=service.plan_show,
+            session_id=session_id,
+            version=version,
         )
 
     @bot.tree.command(name="step_approve", description="Approve a step")
@@ -69,11 +126,9 @@ def create_bot(service: DiscordBotService) -> commands.Bot:
         await _run_command(
             interaction,
             command_name="step_approve",
-            operation=lambda: service.step_approve(
-                user_id=interaction.user.id,
-                session_id=session_id,
-                step_id=step_id,
-            ),
+            method=service.step_approve,
+            session_id=session_id,
+            step_id=step_id,
         )
 
     @bot.tree.command(name="step_execute", description="Execute an approved step")
@@ -81,11 +136,9 @@ def create_bot(service: DiscordBotService) -> commands.Bot:
         await _run_command(
             interaction,
             command_name="step_execute",
-            operation=lambda: service.step_execute(
-                user_id=interaction.user.id,
-                session_id=session_id,
-                step_id=step_id,
-            ),
+            method=service.step_execute,
+            session_id=session_id,
+            step_id=step_id,
         )
 
     @bot.tree.command(name="session_stop", description="Stop a running session")
@@ -93,10 +146,8 @@ def create_bot(service: DiscordBotService) -> commands.Bot:
         await _run_command(
             interaction,
             command_name="session_stop",
-            operation=lambda: service.session_stop(
-                user_id=interaction.user.id,
-                session_id=session_id,
-            ),
+            method=service.session_stop,
+            session_id=session_id,
         )
 
     @bot.tree.command(name="logs_search", description="Search session events")
@@ -108,11 +159,9 @@ def create_bot(service: DiscordBotService) -> commands.Bot:
         await _run_command(
             interaction,
             command_name="logs_search",
-            operation=lambda: service.logs_search(
-                user_id=interaction.user.id,
-                session_id=session_id,
-                q=q,
-            ),
+            method=service.logs_search,
+            session_id=session_id,
+            q=q,
         )
 
     @bot.tree.command(name="artifacts_list", description="List session artifacts")
@@ -120,10 +169,8 @@ def create_bot(service: DiscordBotService) -> commands.Bot:
         await _run_command(
             interaction,
             command_name="artifacts_list",
-            operation=lambda: service.artifacts_list(
-                user_id=interaction.user.id,
-                session_id=session_id,
-            ),
+            method=service.artifacts_list,
+            session_id=session_id,
         )
 
     @bot.tree.command(name="tools_permissions", description="Show tool permission profile")
@@ -131,10 +178,8 @@ def create_bot(service: DiscordBotService) -> commands.Bot:
         await _run_command(
             interaction,
             command_name="tools_permissions",
-            operation=lambda: service.tools_permissions(
-                user_id=interaction.user.id,
-                tool_name=tool_name,
-            ),
+            method=service.tools_permissions,
+            tool_name=tool_name,
         )
 
     return bot
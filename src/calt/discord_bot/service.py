@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Iterable, Protocol
+import time
+from typing import Any, Awaitable, Callable, Iterable, Protocol, TypeVar
+
+READ_CACHE_TTL_SEC = 5.0
+_READ_CACHE_MAX_ENTRIES = 256
+
+_T = TypeVar("_T")
 
 
 class DiscordAuthorizationError(PermissionError):
@@ -38,41 +44,85 @@ class DiscordBotService:
         *,
         client: DiscordDaemonClientProtocol,
         allowed_user_ids: Iterable[int],
+        read_cache_ttl_sec: float = READ_CACHE_TTL_SEC,
     ) -> None:
-        user_ids = {int(user_id) for user_id in allowed_user_ids}
+        user_ids = frozenset(int(user_id) for user_id in allowed_user_ids)
         if not user_ids:
             raise ValueError("allowed_user_ids must not be empty")
-        self._allowed_user_ids = user_ids
+        self._allowed_user_ids: frozenset[int] = user_ids
         self._client = client
+        self._read_cache_ttl_sec = read_cache_ttl_sec
+        self._read_cache: dict[tuple[Any, ...], tuple[float, dict[str, Any]]] = {}
+        self._read_cache_generation = 0
 
     def _authorize(self, user_id: int) -> None:
-        if int(user_id) not in self._allowed_user_ids:
+        if user_id not in self._allowed_user_ids:
             raise DiscordAuthorizationError(f"user {user_id} is not allowed")
 
+    async def _cached_read(
+        self,
+        key: tuple[Any, ...],
+        fetch: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        if self._read_cache_ttl_sec <= 0:
+            return await fetch()
+        now = time.monotonic()
+        cached = self._read_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        generation = self._read_cache_generation
+        result = await fetch()
+        if generation != self._read_cache_generation:
+            # A write finished while this read was in flight; its result may predate it.
+            return result
+        if key not in self._read_cache and len(self._read_cache) >= _READ_CACHE_MAX_ENTRIES:
+            del self._read_cache[next(iter(self._read_cache))]
+        self._read_cache[key] = (now + self._read_cache_ttl_sec, result)
+        return result
+
+    def _invalidate_reads(self) -> None:
+        self._read_cache_generation += 1
+        self._read_cache.clear()
+
+    async def _write(self, call: Awaitable[_T]) -> _T:
+        # Invalidate once the write has landed, so reads cached while it ran are dropped.
+        try:
+            return await call
+        finally:
+            self._invalidate_reads()
+
     async def session_create(self, *, user_id: int, goal: str | None = None) -> dict[str, Any]:
         self._authorize(user_id)
-        return await self._client.create_session(goal=goal)
+        return await self._write(self._client.create_session(goal=goal))
 
     async def plan_show(self, *, user_id: int, session_id: str, version: int) -> dict[str, Any]:
         self._authorize(user_id)
-        return await self._client.get_plan(session_id=session_id, version=version)
+        return await self._cached_read(
+            ("plan_show", session_id, version),
+            lambda: self._client.get_plan(session_id=session_id, version=version),
+        )
 
     async def step_approve(self, *, user_id: int, session_id: str, step_id: str) -> dict[str, Any]:
         self._authorize(user_id)
-        return await self._client.approve_step(
-            session_id=session_id,
-            step_id=step_id,
-            approved_by=str(user_id),
-            source="discord",
+        return await self._write(
+            self._client.approve_step(
+                session_id=session_id,
+                step_id=step_id,
+                approved_by=str(user_id),
+                source="discord",
+            )
         )
 
     async def step_execute(self, *, user_id: int, session_id: str, step_id: str) -> dict[str, Any]:
         self._authorize(user_id)
-        return await self._client.execute_step(session_id=session_id, step_id=step_id)
+        return await self._write(
+            self._client.execute_step(session_id=session_id, step_id=step_id)
+        )
 
     async def session_stop(self, *, user_id: int, session_id: str) -> dict[str, Any]:
         self._authorize(user_id)
-        return await self._client.stop_session(session_id=session_id)
+        return await self._write(self._client.stop_session(session_id=session_id))
 
     async def logs_search(
         self,
@@ -82,12 +132,21 @@ class DiscordBotService:
         q: str | None = None,
     ) -> dict[str, Any]:
         self._authorize(user_id)
-        return await self._client.search_events(session_id=session_id, q=q)
+        return await self._cached_read(
+            ("logs_search", session_id, q),
+            lambda: self._client.search_events(session_id=session_id, q=q),
+        )
 
     async def artifacts_list(self, *, user_id: int, session_id: str) -> dict[str, Any]:
         self._authorize(user_id)
-        return await self._client.list_artifacts(session_id=session_id)
+        return await self._cached_read(
+            ("artifacts_list", session_id),
+            lambda: self._client.list_artifacts(session_id=session_id),
+        )
 
     async def tools_permissions(self, *, user_id: int, tool_name: str) -> dict[str, Any]:
         self._authorize(user_id)
-        return await self._client.get_tool_permissions(tool_name=tool_name)
+        return await self._cached_read(
+            ("tools_permissions", tool_name),
+            lambda: self._client.get_tool_permissions(tool_name=tool_name),
+        )
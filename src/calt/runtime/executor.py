@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import concurrent.futures
+import json
+import os
+import secrets
 from typing import Any, Literal
-from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
@@ -12,7 +15,7 @@ from calt.tools import READONLY_TOOLS, apply_patch, write_file_apply, write_file
 class RuntimeArtifact(BaseModel):
     name: str
     kind: str = "json"
-    payload: dict[str, Any]
+    payload: bytes
 
 
 class StepRunResult(BaseModel):
@@ -22,14 +25,38 @@ class StepRunResult(BaseModel):
     artifacts: list[RuntimeArtifact] = Field(default_factory=list)
 
 
+_DEFAULT_MAX_WORKERS = max(4, os.cpu_count() or 2)
+
+
+def _serialize_artifact_payload(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload, ensure_ascii=True, indent=2, sort_keys=True).encode("utf-8")
+
+
 class StepExecutor:
-    def execute(self, *, tool: str, inputs: dict[str, Any], timeout: int) -> StepRunResult:
+    def __init__(self, *, max_workers: int | None = None) -> None:
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers or _DEFAULT_MAX_WORKERS,
+            thread_name_prefix="calt-step",
+        )
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    async def execute(self, *, tool: str, inputs: dict[str, Any], timeout: int) -> StepRunResult:
         bounded_timeout = max(1, int(timeout))
+        loop = asyncio.get_running_loop()
         try:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(self._invoke, tool, dict(inputs), bounded_timeout)
-                output = future.result(timeout=bounded_timeout)
-        except concurrent.futures.TimeoutError:
+            output, artifact_payload = await asyncio.wait_for(
+                loop.run_in_executor(
+                    self._pool,
+                    self._invoke_and_serialize,
+                    tool,
+                    inputs,
+                    bounded_timeout,
+                ),
+                timeout=bounded_timeout,
+            )
+        except TimeoutError:
             return StepRunResult(
                 status="failed",
                 error=f"tool timeout after {bounded_timeout}s",
@@ -42,17 +69,27 @@ class StepExecutor:
             output=output,
             artifacts=[
                 RuntimeArtifact(
-                    name=f"{tool}_{uuid4().hex[:8]}.json",
+                    name=f"{tool}_{secrets.token_hex(4)}.json",
                     kind="json",
-                    payload=output,
+                    payload=artifact_payload,
                 )
             ],
         )
 
+    def _invoke_and_serialize(
+        self,
+        tool: str,
+        inputs: dict[str, Any],
+        timeout: int,
+    ) -> tuple[dict[str, Any], bytes]:
+        output = self._invoke(tool, inputs, timeout)
+        return output, _serialize_artifact_payload(output)
+
     def _invoke(self, tool: str, inputs: dict[str, Any], timeout: int) -> dict[str, Any]:
+        # inputs is the caller's dict and may still be in use after a timeout; never mutate it.
         if tool in READONLY_TOOLS:
-            if tool == "run_shell_readonly":
-                inputs.setdefault("timeout_sec", min(timeout, 30))
+            if tool == "run_shell_readonly" and "timeout_sec" not in inputs:
+                inputs = {**inputs, "timeout_sec": min(timeout, 30)}
             return READONLY_TOOLS[tool].invoke(inputs).model_dump(mode="json")
 
         if tool == "write_file_preview":
@@ -1,3 +1,15 @@
-from .sqlite import connect_sqlite, init_sqlite, initialize_storage
+from .sqlite import (
+    SCHEMA_VERSION,
+    SQLiteConnectionPool,
+    connect_sqlite,
+    init_sqlite,
+    initialize_storage,
+)
 
-__all__ = ["connect_sqlite", "init_sqlite", "initialize_storage"]
+__all__ = [
+    "SCHEMA_VERSION",
+    "SQLiteConnectionPool",
+    "connect_sqlite",
+    "init_sqlite",
+    "initialize_storage",
+]
@@ -1,10 +1,25 @@
 from __future__ import annotations
 
+import queue
 import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Final
 
-SCHEMA_SQL: Final[str] = """
+# External-content index over events(summary, payload_text). columnsize=0 skips the
+# per-row docsize shadow table; nothing ranks with bm25, so it is pure write overhead.
+EVENTS_FTS_TABLE_SQL: Final[str] = """
+CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+    summary,
+    payload_text,
+    content = 'events',
+    content_rowid = 'id',
+    columnsize = 0
+);
+"""
+
+SCHEMA_SQL: Final[str] = f"""
 PRAGMA foreign_keys = ON;
 
 CREATE TABLE IF NOT EXISTS sessions (
@@ -35,7 +50,7 @@ CREATE TABLE IF NOT EXISTS steps (
     tool_name TEXT NOT NULL,
     status TEXT NOT NULL DEFAULT 'pending',
     risk TEXT NOT NULL DEFAULT 'low',
-    payload_json TEXT NOT NULL DEFAULT '{}',
+    payload_json TEXT NOT NULL DEFAULT '{{}}',
     created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
     UNIQUE(plan_id, step_key)
 );
@@ -99,20 +114,17 @@ CREATE TABLE IF NOT EXISTS tool_registry (
 
 CREATE INDEX IF NOT EXISTS idx_plans_session_id ON plans(session_id);
 CREATE INDEX IF NOT EXISTS idx_steps_plan_id ON steps(plan_id);
+CREATE INDEX IF NOT EXISTS idx_steps_plan_status ON steps(plan_id, status);
 CREATE INDEX IF NOT EXISTS idx_runs_session_id ON runs(session_id);
 CREATE INDEX IF NOT EXISTS idx_runs_step_id ON runs(step_id);
 CREATE INDEX IF NOT EXISTS idx_events_session_id ON events(session_id);
 CREATE INDEX IF NOT EXISTS idx_events_run_id ON events(run_id);
 CREATE INDEX IF NOT EXISTS idx_artifacts_session_id ON artifacts(session_id);
 CREATE INDEX IF NOT EXISTS idx_approvals_session_id ON approvals(session_id);
+CREATE INDEX IF NOT EXISTS idx_approvals_session_type_plan_step
+    ON approvals(session_id, approval_type, plan_id, step_id, approved);
 
-CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
-    summary,
-    payload_text,
-    content = 'events',
-    content_rowid = 'id'
-);
-
+{EVENTS_FTS_TABLE_SQL}
 CREATE TRIGGER IF NOT EXISTS trg_events_fts_insert
 AFTER INSERT ON events
 BEGIN
@@ -184,13 +196,59 @@ GROUP BY session_id, COALESCE(failure_reason, 'unknown');
 """
 
 
-def connect_sqlite(database: str | Path) -> sqlite3.Connection:
-    database_path = Path(database)
-    database_path.parent.mkdir(parents=True, exist_ok=True)
-    connection = sqlite3.connect(str(database_path))
+SCHEMA_VERSION: Final[int] = 2
+
+STATEMENT_CACHE_SIZE: Final[int] = 256
+
+CONNECTION_PRAGMAS_SQL: Final[str] = """
+PRAGMA foreign_keys = ON;
+PRAGMA busy_timeout = 5000;
+PRAGMA journal_mode = WAL;
+PRAGMA wal_autocheckpoint = 1000;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA mmap_size = 268435456;
+PRAGMA cache_size = -65536;
+"""
+
+# Readers must not touch journal_mode: switching it is a write, and the database is
+# already in WAL mode by the time a read-only connection opens it.
+READ_ONLY_CONNECTION_PRAGMAS_SQL: Final[str] = """
+PRAGMA busy_timeout = 5000;
+PRAGMA temp_store = MEMORY;
+PRAGMA mmap_size = 268435456;
+PRAGMA cache_size = -65536;
+PRAGMA query_only = ON;
+"""
+
+
+def connect_sqlite(
+    database: str | Path,
+    *,
+    check_same_thread: bool = True,
+    read_only: bool = False,
+) -> sqlite3.Connection:
+    if isinstance(database, str) and database.startswith("file:"):
+        # SQLite URIs (e.g. shared-cache in-memory databases) are opened as given;
+        # read-only connections rely on query_only rather than mode=ro.
+        target, uri = database, True
+    elif read_only:
+        target, uri = f"{Path(database).resolve().as_uri()}?mode=ro", True
+    else:
+        Path(database).parent.mkdir(parents=True, exist_ok=True)
+        target, uri = str(database), False
+
+    connection = sqlite3.connect(
+        target,
+        check_same_thread=check_same_thread,
+        cached_statements=STATEMENT_CACHE_SIZE,
+        isolation_level=None,
+        uri=uri,
+    )
     connection.row_factory = sqlite3.Row
-    connection.execute("PRAGMA foreign_keys = ON;")
-    connection.execute("PRAGMA busy_timeout = 5000;")
+    connection.executescript(
+        READ_ONLY_CONNECTION_PRAGMAS_SQL if read_only else CONNECTION_PRAGMAS_SQL
+    )
     return connection
 
 
@@ -216,13 +274,81 @@ def _ensure_sessions_safety_profile_column(connection: sqlite3.Connection) -> No
     )
 
 
+def _events_fts_has_docsize_table(connection: sqlite3.Connection) -> bool:
+    row = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'events_fts_docsize'"
+    ).fetchone()
+    return row is not None
+
+
+def _rebuild_events_fts(connection: sqlite3.Connection) -> None:
+    connection.execute("DROP TABLE IF EXISTS events_fts")
+    connection.execute(EVENTS_FTS_TABLE_SQL)
+    connection.execute("INSERT INTO events_fts(events_fts) VALUES ('rebuild')")
+
+
 def initialize_storage(connection: sqlite3.Connection) -> None:
-    connection.executescript(SCHEMA_SQL)
-    _ensure_sessions_mode_column(connection)
-    _ensure_sessions_safety_profile_column(connection)
+    current_version = connection.execute("PRAGMA user_version").fetchone()[0]
+    if current_version >= SCHEMA_VERSION:
+        return
+
+    # executescript() leaves the script's BEGIN open so the column backfills and the
+    # version bump commit together with the schema.
+    connection.executescript(f"BEGIN IMMEDIATE;\n{SCHEMA_SQL}")
+    try:
+        _ensure_sessions_mode_column(connection)
+        _ensure_sessions_safety_profile_column(connection)
+        if _events_fts_has_docsize_table(connection):
+            _rebuild_events_fts(connection)
+        connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    except BaseException:
+        connection.rollback()
+        raise
+    connection.commit()
 
 
 def init_sqlite(database: str | Path) -> sqlite3.Connection:
     connection = connect_sqlite(database)
     initialize_storage(connection)
     return connection
+
+
+class SQLiteConnectionPool:
+    """Fixed-size pool of long-lived connections shared across request threads."""
+
+    def __init__(
+        self,
+        database: str | Path,
+        *,
+        size: int = 4,
+        read_only: bool = False,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self._connections: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=size)
+        for _ in range(size):
+            self._connections.put(
+                connect_sqlite(database, check_same_thread=False, read_only=read_only)
+            )
+
+    @contextmanager
+    def connection(self, *, timeout: float | None = None) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection; raises TimeoutError if none frees up within timeout."""
+        try:
+            connection = self._connections.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("no pooled SQLite connection became available") from None
+        try:
+            yield connection
+        finally:
+            if connection.in_transaction:
+                connection.rollback()
+            self._connections.put(connection)
+
+    def close(self) -> None:
+        while True:
+            try:
+                connection = self._connections.get_nowait()
+            except queue.Empty:
+                return
+            connection.close()
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import os
+import re
 import shlex
+import signal
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Sequence
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .interfaces import PermissionProfile, ToolDefinition
 
@@ -20,40 +24,63 @@ ALLOWLIST_COMMAND_PREFIXES: tuple[tuple[str, ...], ...] = (
 )
 
 
+def _group_prefixes_by_head(
+    prefixes: Sequence[tuple[str, ...]],
+) -> dict[str, tuple[tuple[str, ...], ...]]:
+    grouped: dict[str, list[tuple[str, ...]]] = {}
+    for prefix in prefixes:
+        grouped.setdefault(prefix[0], []).append(prefix)
+    return {head: tuple(group) for head, group in grouped.items()}
+
+
+_ALLOWLIST_BY_HEAD = _group_prefixes_by_head(ALLOWLIST_COMMAND_PREFIXES)
+
+
+@lru_cache(maxsize=64)
 def _ensure_workspace_root(workspace_root: str) -> Path:
-    root = Path(workspace_root).resolve()
-    if not root.exists() or not root.is_dir():
+    root = os.path.realpath(workspace_root)
+    if not os.path.isdir(root):
         raise ValueError("workspace_root must be an existing directory")
-    return root
+    return Path(root)
 
 
 def _resolve_workspace_path(workspace_root: Path, path: str) -> Path:
-    resolved_path = (workspace_root / path).resolve()
-    if not resolved_path.is_relative_to(workspace_root):
+    root = str(workspace_root)
+    resolved_path = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath((root, resolved_path)) != root:
         raise ValueError("path must stay within workspace_root")
-    return resolved_path
+    return Path(resolved_path)
 
 
-def _tokens_match_allowlist(tokens: Sequence[str]) -> bool:
-    return any(
-        len(tokens) >= len(prefix) and tuple(tokens[: len(prefix)]) == prefix
-        for prefix in ALLOWLIST_COMMAND_PREFIXES
-    )
+def _tokens_match_allowlist(tokens: tuple[str, ...]) -> bool:
+    candidates = _ALLOWLIST_BY_HEAD.get(tokens[0]) if tokens else None
+    if candidates is None:
+        return False
+    return any(tokens[: len(prefix)] == prefix for prefix in candidates)
+
+
+# Quotes, backslashes, or whitespace that str.split() treats differently from shlex.
+_SHLEX_SPECIAL_RE = re.compile(r"[\"'\\]|[^\S \t\r\n]")
+
+
+@lru_cache(maxsize=512)
+def _split_command(command: str) -> tuple[str, ...]:
+    if _SHLEX_SPECIAL_RE.search(command) is None:
+        return tuple(command.split())
+    return tuple(shlex.split(command))
 
 
 def is_allowlisted_command(command: str) -> bool:
     try:
-        tokens = shlex.split(command)
+        tokens = _split_command(command)
     except ValueError:
         return False
-    if not tokens:
-        return False
     return _tokens_match_allowlist(tokens)
 
 
 def _parse_allowlisted_command(command: str) -> list[str]:
     try:
-        tokens = shlex.split(command)
+        tokens = _split_command(command)
     except ValueError as error:
         raise ValueError("command could not be parsed") from error
 
@@ -61,10 +88,12 @@ def _parse_allowlisted_command(command: str) -> list[str]:
         raise ValueError("command must not be empty")
     if not _tokens_match_allowlist(tokens):
         raise ValueError(f"command is not allowlisted: {command}")
-    return tokens
+    return list(tokens)
 
 
 class ReadFileInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     workspace_root: str
     path: str = Field(min_length=1)
     encoding: str = "utf-8"
@@ -88,6 +117,8 @@ class DirEntry(BaseModel):
 
 
 class ListDirInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     workspace_root: str
     path: str = "."
 
@@ -103,14 +134,17 @@ def list_dir(params: ListDirInput) -> ListDirOutput:
     if not target_path.is_dir():
         raise ValueError("target path is not a directory")
 
-    entries = [
-        DirEntry(name=entry.name, is_dir=entry.is_dir())
-        for entry in sorted(target_path.iterdir(), key=lambda item: item.name)
-    ]
+    with os.scandir(target_path) as scanned:
+        entries = [
+            DirEntry(name=entry.name, is_dir=entry.is_dir())
+            for entry in sorted(scanned, key=lambda item: item.name)
+        ]
     return ListDirOutput(path=params.path, entries=entries)
 
 
 class RunShellReadonlyInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     workspace_root: str
     command: str = Field(min_length=1)
     timeout_sec: int = Field(default=30, ge=1, le=30)
@@ -121,24 +155,53 @@ class RunShellReadonlyOutput(BaseModel):
     exit_code: int
     stdout: str
     stderr: str
+    truncated: bool = False
+
+
+MAX_OUTPUT_BYTES = 256 * 1024
+_TERMINATE_GRACE_SEC = 1.0
+
+
+def _kill_process_group(process: subprocess.Popen[bytes]) -> None:
+    for kill_signal in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(process.pid, kill_signal)
+        except ProcessLookupError:
+            return
+        try:
+            process.wait(timeout=_TERMINATE_GRACE_SEC)
+        except subprocess.TimeoutExpired:
+            continue
+        return
+
+
+def _decode_capped(data: bytes) -> str:
+    return data[:MAX_OUTPUT_BYTES].decode("utf-8", errors="replace")
 
 
 def run_shell_readonly(params: RunShellReadonlyInput) -> RunShellReadonlyOutput:
     workspace_root = _ensure_workspace_root(params.workspace_root)
     tokens = _parse_allowlisted_command(params.command)
-    completed = subprocess.run(
+    # A separate session lets a timeout take down the whole process group, not just the leader.
+    with subprocess.Popen(
         tokens,
         cwd=workspace_root,
-        capture_output=True,
-        text=True,
-        check=False,
-        timeout=params.timeout_sec,
-    )
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True,
+    ) as process:
+        try:
+            stdout, stderr = process.communicate(timeout=params.timeout_sec)
+        except subprocess.TimeoutExpired:
+            _kill_process_group(process)
+            raise
     return RunShellReadonlyOutput(
         command=params.command,
-        exit_code=completed.returncode,
-        stdout=completed.stdout,
-        stderr=completed.stderr,
+        exit_code=process.returncode,
+        stdout=_decode_capped(stdout),
+        stderr=_decode_capped(stderr),
+        truncated=len(stdout) > MAX_OUTPUT_BYTES or len(stderr) > MAX_OUTPUT_BYTES,
     )
 
 
@@ -2,13 +2,31 @@ from __future__ import annotations
 
 import difflib
 import hashlib
-import re
+import mmap
+import os
+import secrets
+import stat
+import threading
+import time
+from functools import lru_cache
+from itertools import groupby, islice
 from pathlib import Path
-from typing import Any, Literal, Mapping
+from typing import Any, Iterator, Literal, Mapping
 
-_HUNK_HEADER_RE = re.compile(
-    r"^@@ -(?P<old_start>\d+)(?:,\d+)? \+(?P<new_start>\d+)(?:,\d+)? @@"
-)
+try:
+    from cdifflib import CSequenceMatcher as _SequenceMatcher  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    _SequenceMatcher = difflib.SequenceMatcher  # type: ignore[assignment,misc]
+
+
+MMAP_READ_THRESHOLD_BYTES = 64 * 1024
+
+# (path, inode, size, mtime_ns, ctime_ns) -> SHA-256 of the file's text as previews read it.
+_DigestCacheKey = tuple[str, int, int, int, int]
+_DIGEST_CACHE_MAX_ENTRIES = 256
+_DIGEST_CACHE_SETTLE_NS = 1_000_000_000
+_digest_cache: dict[_DigestCacheKey, str] = {}
+_digest_cache_lock = threading.Lock()
 
 
 class ToolInputError(ValueError):
@@ -31,51 +49,210 @@ class PatchApplyError(ToolInputError):
     """Raised when patch hunk cannot be applied to current content."""
 
 
-def _sha256(content: str) -> str:
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+# Preview digests are persisted in session events and matched by the daemon's preview
+# gate, so they must not depend on which optional hash libraries happen to be installed.
+def _sha256(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+@lru_cache(maxsize=64)
+def _resolve_workspace_root(workspace_root: str) -> str:
+    return os.path.realpath(workspace_root)
 
 
 def _resolve_workspace_path(
     workspace_root: str | Path,
     relative_path: str,
 ) -> tuple[Path, Path, str]:
-    root = Path(workspace_root).resolve()
-    target = (root / relative_path).resolve()
+    root = _resolve_workspace_root(os.path.abspath(workspace_root))
+    # The target is still resolved through symlinks; only that can catch a link inside the
+    # workspace that points outside it.
+    target = os.path.realpath(os.path.join(root, relative_path))
+    if os.path.commonpath((root, target)) != root:
+        raise WorkspaceBoundaryError(f"path '{relative_path}' is outside workspace '{root}'")
+    root_path = Path(root)
+    target_path = Path(target)
+    return root_path, target_path, target_path.relative_to(root_path).as_posix()
+
+
+def _digest_cache_key(path: Path) -> _DigestCacheKey | None:
     try:
-        canonical = target.relative_to(root).as_posix()
-    except ValueError as exc:
-        raise WorkspaceBoundaryError(
-            f"path '{relative_path}' is outside workspace '{root}'"
-        ) from exc
-    return root, target, canonical
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    # A file touched within the last timestamp tick can change again without its stat
+    # changing, so only settled files are cached (the same rule git uses for its index).
+    if time.time_ns() - st.st_mtime_ns < _DIGEST_CACHE_SETTLE_NS:
+        return None
+    return (str(path), st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
+def _cached_digest(key: _DigestCacheKey | None) -> str | None:
+    if key is None:
+        return None
+    with _digest_cache_lock:
+        return _digest_cache.get(key)
+
+
+def _remember_digest(key: _DigestCacheKey | None, digest: str) -> None:
+    if key is None:
+        return
+    with _digest_cache_lock:
+        if key not in _digest_cache and len(_digest_cache) >= _DIGEST_CACHE_MAX_ENTRIES:
+            del _digest_cache[next(iter(_digest_cache))]
+        _digest_cache[key] = digest
 
 
 def _read_text_if_exists(path: Path) -> str:
-    if not path.exists():
+    try:
+        handle = path.open("rb")
+    except FileNotFoundError:
         return ""
-    return path.read_text(encoding="utf-8")
+    with handle:
+        if os.fstat(handle.fileno()).st_size >= MMAP_READ_THRESHOLD_BYTES:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                text = str(mapped, "utf-8")
+        else:
+            text = handle.read().decode("utf-8")
+    # Match read_text(): universal newlines turn \r\n and lone \r into \n.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _format_unified_range(start: int, stop: int) -> str:
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+# Same output as difflib.unified_diff(..., lineterm=""), but with a pluggable matcher so
+# the C implementation from cdifflib is used when it is installed.
+def _unified_diff(
+    before_lines: list[str],
+    after_lines: list[str],
+    *,
+    fromfile: str,
+    tofile: str,
+) -> Iterator[str]:
+    if not before_lines or not after_lines:
+        # File creation or truncation is a single hunk of pure inserts or deletes; emit it
+        # directly instead of running the matcher.
+        if before_lines or after_lines:
+            yield f"--- {fromfile}"
+            yield f"+++ {tofile}"
+            old_range = _format_unified_range(0, len(before_lines))
+            new_range = _format_unified_range(0, len(after_lines))
+            yield f"@@ -{old_range} +{new_range} @@"
+            for line in before_lines:
+                yield f"-{line}"
+            for line in after_lines:
+                yield f"+{line}"
+        return
+
+    matcher = _SequenceMatcher(None, before_lines, after_lines)
+    for index, group in enumerate(matcher.get_grouped_opcodes(3)):
+        if index == 0:
+            yield f"--- {fromfile}"
+            yield f"+++ {tofile}"
+        first, last = group[0], group[-1]
+        old_range = _format_unified_range(first[1], last[2])
+        new_range = _format_unified_range(first[3], last[4])
+        yield f"@@ -{old_range} +{new_range} @@"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in before_lines[i1:i2]:
+                    yield f" {line}"
+                continue
+            if tag in {"replace", "delete"}:
+                for line in before_lines[i1:i2]:
+                    yield f"-{line}"
+            if tag in {"replace", "insert"}:
+                for line in after_lines[j1:j2]:
+                    yield f"+{line}"
 
 
-def _build_diff(before: str, after: str, relative_path: str) -> str:
+def _write_bytes_atomic(target: Path, data: bytes) -> None:
+    # Write a sibling temp file and rename it over the target so readers never see a
+    # partially written file. An existing file keeps its permission bits.
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = None
+    temp_path = target.with_name(f".{target.name}.{secrets.token_hex(4)}.tmp")
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        try:
+            if mode is not None:
+                os.fchmod(fd, mode)
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(temp_path, target)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _build_diff(before_lines: list[str], after_lines: list[str], relative_path: str) -> str:
     return "\n".join(
-        difflib.unified_diff(
-            before.splitlines(),
-            after.splitlines(),
+        _unified_diff(
+            before_lines,
+            after_lines,
             fromfile=f"a/{relative_path}",
             tofile=f"b/{relative_path}",
-            lineterm="",
         )
     )
 
 
-def _build_preview_payload(path: str, before: str, after: str) -> dict[str, Any]:
+def _unchanged_preview_payload(path: str, digest: str) -> dict[str, Any]:
     return {
         "path": path,
-        "changed": before != after,
-        "diff": _build_diff(before, after, path),
-        "old_sha256": _sha256(before),
-        "new_sha256": _sha256(after),
+        "changed": False,
+        "diff": "",
+        "old_sha256": digest,
+        "new_sha256": digest,
+    }
+
+
+def _build_preview_payload(
+    path: str,
+    before: str,
+    after: str,
+    *,
+    before_lines: list[str] | None = None,
+    after_lines: list[str] | None = None,
+    after_bytes: bytes | None = None,
+    old_sha256: str | None = None,
+    new_sha256: str | None = None,
+) -> tuple[dict[str, Any], bytes]:
+    if after_bytes is None:
+        after_bytes = after.encode("utf-8")
+    if before == after:
+        digest = new_sha256 or old_sha256 or _sha256(after_bytes)
+        return _unchanged_preview_payload(path, digest), after_bytes
+
+    before_bytes = before.encode("utf-8") if old_sha256 is None else b""
+    if before_lines is None:
+        before_lines = before.splitlines()
+    if after_lines is None:
+        after_lines = after.splitlines()
+    payload = {
+        "path": path,
+        "changed": True,
+        "diff": _build_diff(before_lines, after_lines, path),
+        "old_sha256": old_sha256 or _sha256(before_bytes),
+        "new_sha256": new_sha256 or _sha256(after_bytes),
     }
+    return payload, after_bytes
 
 
 def _validate_preview(
@@ -83,23 +260,43 @@ def _validate_preview(
     provided: Mapping[str, Any],
     actual: Mapping[str, Any],
 ) -> None:
-    comparable_keys = ("path", "diff", "new_sha256")
-    for key in comparable_keys:
-        if provided.get(key) != actual.get(key):
-            raise PreviewMismatchError(
-                "provided preview does not match current file state"
-            )
+    # new_sha256 goes first: a stale preview almost always differs there, and comparing the
+    # short digest before the diff lets the tuple comparison stop early.
+    provided_signature = (
+        provided.get("new_sha256"),
+        provided.get("path"),
+        provided.get("diff"),
+    )
+    actual_signature = (actual["new_sha256"], actual["path"], actual["diff"])
+    if provided_signature != actual_signature:
+        raise PreviewMismatchError("provided preview does not match current file state")
 
 
 def _compute_write_preview(
     workspace_root: str | Path,
     path: str,
     content: str,
-) -> tuple[Path, dict[str, Any]]:
+) -> tuple[Path, dict[str, Any], bytes]:
     _, target, canonical = _resolve_workspace_path(workspace_root, path)
+    content_bytes = content.encode("utf-8")
+    new_sha256 = _sha256(content_bytes)
+    cache_key = _digest_cache_key(target)
+    old_sha256 = _cached_digest(cache_key)
+    if old_sha256 == new_sha256:
+        # Unchanged settled file: the digest match means no read or diff is needed.
+        return target, _unchanged_preview_payload(canonical, new_sha256), content_bytes
+
     before = _read_text_if_exists(target)
-    payload = _build_preview_payload(canonical, before, content)
-    return target, payload
+    payload, _ = _build_preview_payload(
+        canonical,
+        before,
+        content,
+        after_bytes=content_bytes,
+        old_sha256=old_sha256,
+        new_sha256=new_sha256,
+    )
+    _remember_digest(cache_key, payload["old_sha256"])
+    return target, payload, content_bytes
 
 
 def write_file_preview(
@@ -107,7 +304,7 @@ def write_file_preview(
     path: str,
     content: str,
 ) -> dict[str, Any]:
-    _, payload = _compute_write_preview(workspace_root, path, content)
+    _, payload, _ = _compute_write_preview(workspace_root, path, content)
     return payload
 
 
@@ -118,11 +315,13 @@ def write_file_apply(
     *,
     preview: Mapping[str, Any] | None = None,
 ) -> dict[str, Any]:
-    target, actual_preview = _compute_write_preview(workspace_root, path, content)
+    target, actual_preview, content_bytes = _compute_write_preview(
+        workspace_root, path, content
+    )
     if preview is not None:
         _validate_preview(provided=preview, actual=actual_preview)
     target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(content, encoding="utf-8")
+    _write_bytes_atomic(target, content_bytes)
     return {**actual_preview, "applied": True}
 
 
@@ -133,9 +332,31 @@ def _normalize_patch_path(raw_label: str) -> str:
     return token
 
 
+def _is_unified_range(text: str) -> bool:
+    start, separator, length = text.partition(",")
+    return start.isdecimal() and (not separator or length.isdecimal())
+
+
+def _parse_hunk_old_start(line: str) -> int | None:
+    # Accepts exactly what "^@@ -\d+(,\d+)? \+\d+(,\d+)? @@" would, without the regex engine.
+    if not line.startswith("@@ -"):
+        return None
+    old_end = line.find(" +", 4)
+    if old_end < 0:
+        return None
+    new_end = line.find(" @@", old_end + 2)
+    if new_end < 0:
+        return None
+    old_range = line[4:old_end]
+    if not (_is_unified_range(old_range) and _is_unified_range(line[old_end + 2 : new_end])):
+        return None
+    return int(old_range.partition(",")[0])
+
+
 def _parse_single_file_patch(patch: str) -> tuple[str, list[tuple[int, list[str]]]]:
     lines = patch.splitlines()
-    if not lines:
+    line_count = len(lines)
+    if not line_count:
         raise PatchFormatError("patch is empty")
 
     header_index = -1
@@ -143,7 +364,7 @@ def _parse_single_file_patch(patch: str) -> tuple[str, list[tuple[int, list[str]
         if line.startswith("--- "):
             header_index = idx
             break
-    if header_index < 0 or header_index + 1 >= len(lines):
+    if header_index < 0 or header_index + 1 >= line_count:
         raise PatchFormatError("patch must include ---/+++ headers")
 
     next_line = lines[header_index + 1]
@@ -159,41 +380,38 @@ def _parse_single_file_patch(patch: str) -> tuple[str, list[tuple[int, list[str]
     if target_path in {"", "/dev/null"}:
         raise PatchFormatError("patch target path is invalid")
 
+    # One C-driven pass finds every line that can start a hunk or another file; everything
+    # between two markers is either a hunk body or ignorable noise before the first hunk.
+    markers = [
+        index
+        for index, line in islice(enumerate(lines), header_index + 2, None)
+        if line.startswith(("@@ ", "--- "))
+    ]
     hunks: list[tuple[int, list[str]]] = []
-    index = header_index + 2
-    while index < len(lines):
-        line = lines[index]
-        if line.startswith("diff --git ") or line.startswith("index "):
-            index += 1
-            continue
+    for position, marker in enumerate(markers):
+        line = lines[marker]
         if line.startswith("--- "):
             raise PatchFormatError("multiple file patches are not supported")
-        if not line.startswith("@@ "):
-            index += 1
-            continue
-
-        match = _HUNK_HEADER_RE.match(line)
-        if match is None:
+        old_start = _parse_hunk_old_start(line)
+        if old_start is None:
             raise PatchFormatError(f"invalid hunk header: {line}")
-        old_start = int(match.group("old_start"))
-        index += 1
-
-        hunk_lines: list[str] = []
-        while index < len(lines):
-            candidate = lines[index]
-            if candidate.startswith("@@ ") or candidate.startswith("--- "):
-                break
-            hunk_lines.append(candidate)
-            index += 1
-        hunks.append((old_start, hunk_lines))
+        body_end = markers[position + 1] if position + 1 < len(markers) else line_count
+        hunks.append((old_start, lines[marker + 1 : body_end]))
 
     if not hunks:
         raise PatchFormatError("patch must include at least one hunk")
     return target_path, hunks
 
 
-def _apply_hunks(before: str, hunks: list[tuple[int, list[str]]]) -> str:
-    old_lines = before.splitlines()
+def _hunk_line_op(raw_line: str) -> str:
+    return raw_line[:1]
+
+
+def _apply_hunks(
+    old_lines: list[str],
+    before_ends_with_newline: bool,
+    hunks: list[tuple[int, list[str]]],
+) -> tuple[str, list[str]]:
     result: list[str] = []
     cursor = 0
 
@@ -205,45 +423,63 @@ def _apply_hunks(before: str, hunks: list[tuple[int, list[str]]]) -> str:
         result.extend(old_lines[cursor:start_index])
         cursor = start_index
 
-        for raw_line in hunk_lines:
-            if raw_line.startswith("\\ No newline at end of file"):
+        # Consecutive lines with the same operation are checked and copied as one slice.
+        for op, run in groupby(hunk_lines, key=_hunk_line_op):
+            if op == "\\":
+                for raw_line in run:
+                    if not raw_line.startswith("\\ No newline at end of file"):
+                        raise PatchApplyError(f"unsupported hunk operation: {op}")
                 continue
-            if not raw_line:
+            if not op:
                 raise PatchApplyError("invalid hunk line")
+            if op not in {" ", "-", "+"}:
+                raise PatchApplyError(f"unsupported hunk operation: {op}")
 
-            op = raw_line[0]
-            text = raw_line[1:]
+            texts = [raw_line[1:] for raw_line in run]
+            if op == "+":
+                result.extend(texts)
+                continue
+
+            run_end = cursor + len(texts)
+            if old_lines[cursor:run_end] != texts:
+                line_kind = "context" if op == " " else "deletion"
+                raise PatchApplyError(f"{line_kind} line does not match current content")
             if op == " ":
-                if cursor >= len(old_lines) or old_lines[cursor] != text:
-                    raise PatchApplyError("context line does not match current content")
-                result.append(text)
-                cursor += 1
-            elif op == "-":
-                if cursor >= len(old_lines) or old_lines[cursor] != text:
-                    raise PatchApplyError("deletion line does not match current content")
-                cursor += 1
-            elif op == "+":
-                result.append(text)
-            else:
-                raise PatchApplyError(f"unsupported hunk operation: {op}")
+                result.extend(texts)
+            cursor = run_end
 
     result.extend(old_lines[cursor:])
+    if before_ends_with_newline and result and result[-1]:
+        # Joining with an empty last element adds the final newline without copying after.
+        result.append("")
     after = "\n".join(result)
-    if before.endswith("\n") and after and not after.endswith("\n"):
-        after += "\n"
-    return after
+    # Same list after.splitlines() would give: a trailing empty line only marks the
+    # final newline.
+    if result and not result[-1]:
+        result.pop()
+    return after, result
 
 
 def _compute_patch_preview(
     workspace_root: str | Path,
     patch: str,
-) -> tuple[Path, str, dict[str, Any]]:
+) -> tuple[Path, bytes, dict[str, Any]]:
     patch_path, hunks = _parse_single_file_patch(patch)
     _, target, canonical = _resolve_workspace_path(workspace_root, patch_path)
+    cache_key = _digest_cache_key(target)
     before = _read_text_if_exists(target)
-    after = _apply_hunks(before, hunks)
-    payload = _build_preview_payload(canonical, before, after)
-    return target, after, payload
+    before_lines = before.splitlines()
+    after, after_lines = _apply_hunks(before_lines, before.endswith("\n"), hunks)
+    payload, after_bytes = _build_preview_payload(
+        canonical,
+        before,
+        after,
+        before_lines=before_lines,
+        after_lines=after_lines,
+        old_sha256=_cached_digest(cache_key),
+    )
+    _remember_digest(cache_key, payload["old_sha256"])
+    return target, after_bytes, payload
 
 
 def apply_patch(
@@ -256,7 +492,7 @@ def apply_patch(
     if mode not in {"preview", "apply"}:
         raise ToolInputError("mode must be 'preview' or 'apply'")
 
-    target, after, actual_preview = _compute_patch_preview(workspace_root, patch)
+    target, after_bytes, actual_preview = _compute_patch_preview(workspace_root, patch)
     if mode == "preview":
         return actual_preview
 
@@ -264,5 +500,5 @@ def apply_patch(
         _validate_preview(provided=preview, actual=actual_preview)
 
     target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(after, encoding="utf-8")
+    _write_bytes_atomic(target, after_bytes)
     return {**actual_preview, "applied": True}
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import importlib.util
+
+import pytest
+
+# Match the daemon's "auto" loop: run on uvloop when it is installed.
+_USE_UVLOOP = importlib.util.find_spec("uvloop") is not None
+
+
+@pytest.fixture(scope="module")
+def anyio_backend() -> tuple[str, dict[str, bool]]:
+    return ("asyncio", {"use_uvloop": _USE_UVLOOP})
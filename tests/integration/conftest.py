@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import sqlite3
+import uuid
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from calt.daemon import create_app
+from calt.storage import SQLiteConnectionPool
+
+
+@pytest.fixture(scope="session")
+def template_database_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    database_path = tmp_path_factory.mktemp("template") / "daemon.sqlite3"
+    app = create_app(database_path)
+    # Close readers first so the last writer checkpoints the WAL into the main file.
+    app.state.read_connection_pool.close()
+    app.state.connection_pool.close()
+    return database_path
+
+
+@pytest.fixture
+def database_uri() -> str:
+    return f"file:memdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
+
+
+@pytest.fixture
+def verify_connection(
+    database_uri: str,
+    template_database_path: Path,
+) -> Iterator[sqlite3.Connection]:
+    # Also keeps the shared in-memory database alive, which lasts only while a connection
+    # holds it open. Tests read through it instead of opening their own connections.
+    connection = sqlite3.connect(database_uri, uri=True)
+    template = sqlite3.connect(template_database_path)
+    try:
+        template.backup(connection)
+    finally:
+        template.close()
+    connection.execute("PRAGMA query_only = ON")
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def database_path(database_uri: str, verify_connection: sqlite3.Connection) -> str:
+    return database_uri
+
+
+@pytest.fixture(scope="session")
+def data_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    root = tmp_path_factory.mktemp("daemon") / "data"
+    root.mkdir()
+    return root
+
+
+@pytest.fixture(scope="session")
+def daemon_app(template_database_path: Path, data_root: Path) -> Iterator[FastAPI]:
+    app = create_app(template_database_path, data_root=data_root)
+    template_pools = (app.state.read_connection_pool, app.state.connection_pool)
+    yield app
+    for pool in template_pools:
+        pool.close()
+
+
+@pytest.fixture
+def app(daemon_app: FastAPI, database_path: str) -> Iterator[FastAPI]:
+    # The ASGI app is shared by every test; each test rebinds its pools to its own database.
+    state = daemon_app.state
+    template_pools = (state.connection_pool, state.read_connection_pool)
+    state.connection_pool = SQLiteConnectionPool(database_path)
+    state.read_connection_pool = SQLiteConnectionPool(database_path, read_only=True)
+    yield daemon_app
+    state.read_connection_pool.close()
+    state.connection_pool.close()
+    state.connection_pool, state.read_connection_pool = template_pools
+
+
+@pytest.fixture(scope="module")
+async def module_client(daemon_app: FastAPI) -> AsyncIterator[AsyncClient]:
+    transport = ASGITransport(app=daemon_app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as async_client:
+        yield async_client
+
+
+@pytest.fixture
+def client(app: FastAPI, module_client: AsyncClient) -> AsyncClient:
+    return module_client
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import sqlite3
-from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import Any
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
 from calt.daemon import create_app
+from calt.storage import SQLiteConnectionPool
 
 AUTH_HEADERS = {"Authorization": "Bearer test-token"}
 DEFAULT_PLAN_PAYLOAD = {
@@ -26,23 +28,6 @@ DEFAULT_PLAN_PAYLOAD = {
 }
 
 
-@pytest.fixture
-def database_path(tmp_path: Path) -> Path:
-    return tmp_path / "daemon.sqlite3"
-
-
-@pytest.fixture
-def app(database_path: Path):
-    return create_app(database_path)
-
-
-@pytest.fixture
-async def client(app) -> AsyncIterator[AsyncClient]:
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://testserver") as async_client:
-        yield async_client
-
-
 async def _create_session(
     client: AsyncClient,
     *,
@@ -74,7 +59,7 @@ async def _import_plan(
 @pytest.mark.anyio
 async def test_create_session_supports_mode_and_safety_profile_in_request_response_and_db(
     client: AsyncClient,
-    database_path: Path,
+    verify_connection: sqlite3.Connection,
 ) -> None:
     create = await client.post(
         "/api/v1/sessions",
@@ -95,16 +80,12 @@ async def test_create_session_supports_mode_and_safety_profile_in_request_respon
     assert get_payload["mode"] == "dry_run"
     assert get_payload["safety_profile"] == "dev"
 
-    connection = sqlite3.connect(database_path)
-    try:
-        row = connection.execute(
-            "SELECT safety_profile FROM sessions WHERE id = ?",
-            (payload["id"],),
-        ).fetchone()
-        assert row is not None
-        assert row[0] == "dev"
-    finally:
-        connection.close()
+    row = verify_connection.execute(
+        "SELECT safety_profile FROM sessions WHERE id = ?",
+        (payload["id"],),
+    ).fetchone()
+    assert row is not None
+    assert row[0] == "dev"
 
 
 @pytest.mark.anyio
@@ -158,6 +139,70 @@ async def test_execute_step_allows_after_plan_and_step_approval(client: AsyncCli
     assert session.json()["status"] == "succeeded"
 
 
+@pytest.mark.anyio
+async def test_execute_step_runs_more_tools_concurrently_than_writer_connections(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # A file database, unlike the shared-cache memory one, lets concurrent writers wait
+    # on the busy timeout the way the daemon does in production.
+    database_path = tmp_path / "daemon.sqlite3"
+    app = create_app(database_path, data_root=tmp_path / "data")
+    pool_size = 2
+    concurrent_executes = pool_size + 1
+    app.state.connection_pool.close()
+    app.state.connection_pool = SQLiteConnectionPool(database_path, size=pool_size)
+
+    running = 0
+    all_running = asyncio.Event()
+    execute = app.state.step_executor.execute
+
+    async def execute_when_all_running(**kwargs: Any) -> Any:
+        # Every tool run waits until all of them are in flight, which only happens if
+        # no request holds a writer connection while its tool runs.
+        nonlocal running
+        running += 1
+        if running == concurrent_executes:
+            all_running.set()
+        await asyncio.wait_for(all_running.wait(), timeout=10)
+        return await execute(**kwargs)
+
+    monkeypatch.setattr(app.state.step_executor, "execute", execute_when_all_running)
+    transport = ASGITransport(app=app)
+    try:
+        async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+            session_ids = []
+            for _ in range(concurrent_executes):
+                session_id = await _create_session(client)
+                await _import_plan(client, session_id)
+                for path in ("plans/1/approve", "steps/step_001/approve"):
+                    approve = await client.post(
+                        f"/api/v1/sessions/{session_id}/{path}",
+                        headers=AUTH_HEADERS,
+                        json={"approved_by": "user_1", "source": "integration"},
+                    )
+                    assert approve.status_code == 200
+                session_ids.append(session_id)
+
+            responses = await asyncio.gather(
+                *(
+                    client.post(
+                        f"/api/v1/sessions/{session_id}/steps/step_001/execute",
+                        headers=AUTH_HEADERS,
+                    )
+                    for session_id in session_ids
+                )
+            )
+    finally:
+        app.state.step_executor.close()
+        app.state.artifact_pool.shutdown(wait=True)
+        app.state.read_connection_pool.close()
+        app.state.connection_pool.close()
+
+    assert [response.status_code for response in responses] == [200] * concurrent_executes
+    assert {response.json()["status"] for response in responses} == {"succeeded"}
+
+
 @pytest.mark.anyio
 async def test_execute_step_rejects_high_risk_without_confirm_and_allows_with_confirm(
     client: AsyncClient,
@@ -279,29 +324,41 @@ async def test_execute_step_records_events_and_artifacts(client: AsyncClient) ->
     )
     assert execute.status_code == 200
 
-    events = await client.get(
-        f"/api/v1/sessions/{session_id}/events/search",
-        headers=AUTH_HEADERS,
-        params={"q": "step_executed"},
+    # Read-only requests: their handlers share the read pool and can overlap.
+    events, artifacts, saved_events = await asyncio.gather(
+        client.get(
+            f"/api/v1/sessions/{session_id}/events/search",
+            headers=AUTH_HEADERS,
+            params={"q": "step_executed"},
+        ),
+        client.get(
+            f"/api/v1/sessions/{session_id}/artifacts",
+            headers=AUTH_HEADERS,
+        ),
+        client.get(
+            f"/api/v1/sessions/{session_id}/events/search",
+            headers=AUTH_HEADERS,
+            params={"q": "artifact_saved"},
+        ),
     )
     assert events.status_code == 200
     event_items = events.json()["items"]
     assert any(item["event_type"] == "step_executed" for item in event_items)
 
-    artifacts = await client.get(
-        f"/api/v1/sessions/{session_id}/artifacts",
-        headers=AUTH_HEADERS,
-    )
     assert artifacts.status_code == 200
     artifact_items = artifacts.json()["items"]
     assert len(artifact_items) == 1
     assert artifact_items[0]["path"].startswith(f"data/sessions/{session_id}/artifacts/")
 
+    assert saved_events.status_code == 200
+    saved_items = saved_events.json()["items"]
+    assert [item["payload_text"] for item in saved_items] == [artifact_items[0]["path"]]
+
 
 @pytest.mark.anyio
 async def test_search_events_includes_event_type_in_like_fallback(
     client: AsyncClient,
-    database_path: Path,
+    database_path: str,
 ) -> None:
     session_id = await _create_session(client)
     await _import_plan(client, session_id)
@@ -326,7 +383,7 @@ async def test_search_events_includes_event_type_in_like_fallback(
     )
     assert execute.status_code == 200
 
-    with sqlite3.connect(database_path) as connection:
+    with sqlite3.connect(database_path, uri=True) as connection:
         connection.execute("DROP TABLE events_fts")
         connection.commit()
 
@@ -361,16 +418,15 @@ async def test_stop_session_sets_cancelled_status(client: AsyncClient) -> None:
 
 @pytest.mark.anyio
 async def test_tools_endpoints_return_default_registry(client: AsyncClient) -> None:
-    tools = await client.get("/api/v1/tools", headers=AUTH_HEADERS)
+    tools, permissions = await asyncio.gather(
+        client.get("/api/v1/tools", headers=AUTH_HEADERS),
+        client.get("/api/v1/tools/read_file/permissions", headers=AUTH_HEADERS),
+    )
     assert tools.status_code == 200
     tool_names = {item["tool_name"] for item in tools.json()["items"]}
     assert "read_file" in tool_names
     assert "run_shell_readonly" in tool_names
 
-    permissions = await client.get(
-        "/api/v1/tools/read_file/permissions",
-        headers=AUTH_HEADERS,
-    )
     assert permissions.status_code == 200
     payload = permissions.json()
     assert payload["tool_name"] == "read_file"
@@ -406,3 +462,101 @@ async def test_import_and_get_plan_and_event_search(client: AsyncClient) -> None
     )
     assert artifacts.status_code == 200
     assert artifacts.json()["items"] == []
+
+
+@pytest.mark.anyio
+async def test_event_search_paginates_with_keyset_cursor(client: AsyncClient) -> None:
+    session_id = await _create_session(client)
+    for version in (1, 2, 3):
+        await _import_plan(client, session_id, {**DEFAULT_PLAN_PAYLOAD, "version": version})
+
+    unpaged = await client.get(
+        f"/api/v1/sessions/{session_id}/events/search",
+        headers=AUTH_HEADERS,
+    )
+    assert unpaged.status_code == 200
+    assert unpaged.json()["next_cursor"] is None
+    expected_ids = [item["id"] for item in unpaged.json()["items"]]
+    assert len(expected_ids) >= 3
+
+    paged_ids: list[int] = []
+    params: dict[str, int] = {"limit": 2}
+    while True:
+        page = await client.get(
+            f"/api/v1/sessions/{session_id}/events/search",
+            headers=AUTH_HEADERS,
+            params=params,
+        )
+        assert page.status_code == 200
+        payload = page.json()
+        assert len(payload["items"]) <= 2
+        paged_ids.extend(item["id"] for item in payload["items"])
+        if payload["next_cursor"] is None:
+            break
+        params = {"limit": 2, "cursor": payload["next_cursor"]}
+
+    assert paged_ids == expected_ids
+
+    too_large = await client.get(
+        f"/api/v1/sessions/{session_id}/artifacts",
+        headers=AUTH_HEADERS,
+        params={"limit": 10_000},
+    )
+    assert too_large.status_code == 422
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("query", ["memo.txt", "step-1", "path/to", '"unterminated'])
+async def test_search_events_matches_free_text_with_fts_syntax_characters(
+    client: AsyncClient,
+    query: str,
+) -> None:
+    session_id = await _create_session(client)
+    await _import_plan(
+        client,
+        session_id,
+        {**DEFAULT_PLAN_PAYLOAD, "title": 'edit memo.txt in step-1 under path/to "unterminated'},
+    )
+
+    response = await client.get(
+        f"/api/v1/sessions/{session_id}/events/search",
+        headers=AUTH_HEADERS,
+        params={"q": query},
+    )
+    assert response.status_code == 200
+    event_types = [item["event_type"] for item in response.json()["items"]]
+    assert event_types == ["plan_imported"]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {},
+        {"Authorization": "Basic test-token"},
+        {"Authorization": "Bearer    "},
+    ],
+)
+async def test_endpoints_reject_missing_or_malformed_bearer_token(
+    client: AsyncClient,
+    headers: dict[str, str],
+) -> None:
+    response = await client.get("/api/v1/tools", headers=headers)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "authorization header with bearer token is required"
+
+
+@pytest.mark.anyio
+async def test_bearer_auth_only_guards_api_routes(client: AsyncClient) -> None:
+    schema = await client.get("/openapi.json")
+    assert schema.status_code == 200
+
+    unknown = await client.get("/api/v1/unknown")
+    assert unknown.status_code == 401
+
+
+@pytest.mark.anyio
+async def test_get_session_returns_404_for_unknown_session(client: AsyncClient) -> None:
+    response = await client.get("/api/v1/sessions/missing", headers=AUTH_HEADERS)
+    assert response.status_code == 404
+    assert response.json()["detail"] == "session not found"
@@ -1,42 +1,16 @@
 from __future__ import annotations
 
 import sqlite3
-from collections.abc import AsyncIterator
 from pathlib import Path
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 
-from calt.daemon import create_app
 from calt.tools import apply_patch, write_file_preview
 
 AUTH_HEADERS = {"Authorization": "Bearer test-token"}
 
 
-@pytest.fixture
-def database_path(tmp_path: Path) -> Path:
-    return tmp_path / "daemon.sqlite3"
-
-
-@pytest.fixture
-def data_root(tmp_path: Path) -> Path:
-    root = tmp_path / "data"
-    root.mkdir(parents=True, exist_ok=True)
-    return root
-
-
-@pytest.fixture
-def app(database_path: Path, data_root: Path):
-    return create_app(database_path, data_root=data_root)
-
-
-@pytest.fixture
-async def client(app) -> AsyncIterator[AsyncClient]:
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://testserver") as async_client:
-        yield async_client
-
-
 async def _create_session(
     client: AsyncClient,
     *,
@@ -61,28 +35,76 @@ async def _import_plan(client: AsyncClient, session_id: str, payload: dict[str,
     assert response.status_code == 200
 
 
-async def _approve_plan(client: AsyncClient, session_id: str, version: int = 1) -> None:
-    response = await client.post(
+async def _approve_plan_and_steps(
+    client: AsyncClient,
+    session_id: str,
+    *step_ids: str,
+    version: int = 1,
+) -> None:
+    # Sequential on purpose: concurrent writers on a shared-cache database fail with
+    # SQLITE_LOCKED instead of waiting on busy_timeout, and event order is asserted.
+    approval = {"approved_by": "user_1", "source": "integration"}
+    urls = [
         f"/api/v1/sessions/{session_id}/plans/{version}/approve",
-        headers=AUTH_HEADERS,
-        json={"approved_by": "user_1", "source": "integration"},
-    )
-    assert response.status_code == 200
+        *(f"/api/v1/sessions/{session_id}/steps/{step_id}/approve" for step_id in step_ids),
+    ]
+    for url in urls:
+        response = await client.post(url, headers=AUTH_HEADERS, json=approval)
+        assert response.status_code == 200
 
 
-async def _approve_step(client: AsyncClient, session_id: str, step_id: str) -> None:
-    response = await client.post(
-        f"/api/v1/sessions/{session_id}/steps/{step_id}/approve",
+async def _run_write_preview(
+    client: AsyncClient,
+    data_root: Path,
+    *,
+    title: str,
+    mode: str = "normal",
+    safety_profile: str = "strict",
+) -> tuple[str, Path]:
+    session_id = await _create_session(client, mode=mode, safety_profile=safety_profile)
+    workspace_root = data_root / "sessions" / session_id / "workspace"
+    expected_preview = write_file_preview(workspace_root, "memo.txt", "after\n")
+    plan_payload = {
+        "version": 1,
+        "title": title,
+        "session_goal": title,
+        "steps": [
+            {
+                "id": "step_preview",
+                "title": "preview write",
+                "tool": "write_file_preview",
+                "inputs": {"path": "memo.txt", "content": "after\n"},
+                "timeout_sec": 30,
+            },
+            {
+                "id": "step_apply",
+                "title": "apply write",
+                "tool": "write_file_apply",
+                "inputs": {
+                    "path": "memo.txt",
+                    "content": "after\n",
+                    "preview": expected_preview,
+                },
+                "timeout_sec": 30,
+            },
+        ],
+    }
+    await _import_plan(client, session_id, plan_payload)
+    await _approve_plan_and_steps(client, session_id, "step_preview", "step_apply")
+
+    preview_execute = await client.post(
+        f"/api/v1/sessions/{session_id}/steps/step_preview/execute",
         headers=AUTH_HEADERS,
-        json={"approved_by": "user_1", "source": "integration"},
     )
-    assert response.status_code == 200
+    assert preview_execute.status_code == 200
+    assert preview_execute.json()["status"] == "succeeded"
+    return session_id, workspace_root
 
 
 @pytest.mark.anyio
 async def test_write_apply_without_preview_is_rejected_and_recorded(
     client: AsyncClient,
-    database_path: Path,
+    verify_connection: sqlite3.Connection,
     monkeypatch,
 ) -> None:
     monkeypatch.setattr("calt.daemon.api.is_running_in_docker", lambda: True)
@@ -102,8 +124,7 @@ async def test_write_apply_without_preview_is_rejected_and_recorded(
         ],
     }
     await _import_plan(client, session_id, plan_payload)
-    await _approve_plan(client, session_id)
-    await _approve_step(client, session_id, "step_apply")
+    await _approve_plan_and_steps(client, session_id, "step_apply")
 
     execute = await client.post(
         f"/api/v1/sessions/{session_id}/steps/step_apply/execute",
@@ -114,38 +135,34 @@ async def test_write_apply_without_preview_is_rejected_and_recorded(
     assert execute_payload["status"] == "failed"
     assert "preview gate rejected" in (execute_payload["error"] or "")
 
-    connection = sqlite3.connect(database_path)
-    connection.row_factory = sqlite3.Row
-    try:
-        run_row = connection.execute(
-            """
-            SELECT status, failure_reason
+    rows = verify_connection.execute(
+        """
+        SELECT * FROM (
+            SELECT 'run' AS kind, status AS outcome, failure_reason AS detail
             FROM runs
-            WHERE session_id = ?
+            WHERE session_id = :session_id
             ORDER BY id DESC
             LIMIT 1
-            """,
-            (session_id,),
-        ).fetchone()
-        assert run_row is not None
-        assert run_row["status"] == "failed"
-        assert "preview gate rejected" in (run_row["failure_reason"] or "")
-
-        event_row = connection.execute(
-            """
-            SELECT event_type, payload_text
+        )
+        UNION ALL
+        SELECT * FROM (
+            SELECT 'event', event_type, payload_text
             FROM events
-            WHERE session_id = ? AND run_id = ?
+            WHERE session_id = :session_id AND run_id = :run_id
             ORDER BY id DESC
             LIMIT 1
-            """,
-            (session_id, execute_payload["run_id"]),
-        ).fetchone()
-        assert event_row is not None
-        assert event_row["event_type"] == "step_failed"
-        assert "preview gate rejected" in (event_row["payload_text"] or "")
-    finally:
-        connection.close()
+        )
+        """,
+        {"session_id": session_id, "run_id": execute_payload["run_id"]},
+    ).fetchall()
+    rows_by_kind = {kind: (outcome, detail) for kind, outcome, detail in rows}
+    assert rows_by_kind.keys() == {"run", "event"}
+    run_status, failure_reason = rows_by_kind["run"]
+    assert run_status == "failed"
+    assert "preview gate rejected" in (failure_reason or "")
+    event_type, payload_text = rows_by_kind["event"]
+    assert event_type == "step_failed"
+    assert "preview gate rejected" in (payload_text or "")
 
 
 @pytest.mark.anyio
@@ -168,8 +185,7 @@ async def test_dev_profile_skips_preview_gate_for_write_apply_without_preview(
         ],
     }
     await _import_plan(client, session_id, plan_payload)
-    await _approve_plan(client, session_id)
-    await _approve_step(client, session_id, "step_apply")
+    await _approve_plan_and_steps(client, session_id, "step_apply")
 
     execute = await client.post(
         f"/api/v1/sessions/{session_id}/steps/step_apply/execute",
@@ -185,51 +201,16 @@ async def test_dev_profile_skips_preview_gate_for_write_apply_without_preview(
 @pytest.mark.anyio
 async def test_write_apply_succeeds_after_preview_record(
     client: AsyncClient,
-    database_path: Path,
+    verify_connection: sqlite3.Connection,
     data_root: Path,
     monkeypatch,
 ) -> None:
     monkeypatch.setattr("calt.daemon.api.is_running_in_docker", lambda: True)
-    session_id = await _create_session(client)
-    workspace_root = data_root / "sessions" / session_id / "workspace"
-    expected_preview = write_file_preview(workspace_root, "memo.txt", "after\n")
-
-    plan_payload = {
-        "version": 1,
-        "title": "preview gate allow",
-        "session_goal": "allow apply with preview",
-        "steps": [
-            {
-                "id": "step_preview",
-                "title": "preview write",
-                "tool": "write_file_preview",
-                "inputs": {"path": "memo.txt", "content": "after\n"},
-                "timeout_sec": 30,
-            },
-            {
-                "id": "step_apply",
-                "title": "apply write",
-                "tool": "write_file_apply",
-                "inputs": {
-                    "path": "memo.txt",
-                    "content": "after\n",
-                    "preview": expected_preview,
-                },
-                "timeout_sec": 30,
-            },
-        ],
-    }
-    await _import_plan(client, session_id, plan_payload)
-    await _approve_plan(client, session_id)
-    await _approve_step(client, session_id, "step_preview")
-    await _approve_step(client, session_id, "step_apply")
-
-    preview_execute = await client.post(
-        f"/api/v1/sessions/{session_id}/steps/step_preview/execute",
-        headers=AUTH_HEADERS,
+    session_id, workspace_root = await _run_write_preview(
+        client,
+        data_root,
+        title="preview gate allow",
     )
-    assert preview_execute.status_code == 200
-    assert preview_execute.json()["status"] == "succeeded"
 
     apply_execute = await client.post(
         f"/api/v1/sessions/{session_id}/steps/step_apply/execute",
@@ -242,71 +223,31 @@ async def test_write_apply_succeeds_after_preview_record(
     assert apply_payload["output"]["applied"] is True
     assert (workspace_root / "memo.txt").read_text(encoding="utf-8") == "after\n"
 
-    connection = sqlite3.connect(database_path)
-    connection.row_factory = sqlite3.Row
-    try:
-        run_rows = connection.execute(
-            """
-            SELECT status
-            FROM runs
-            WHERE session_id = ?
-            ORDER BY id
-            """,
-            (session_id,),
-        ).fetchall()
-        assert [row["status"] for row in run_rows] == ["succeeded", "succeeded"]
-    finally:
-        connection.close()
+    succeeded, total = verify_connection.execute(
+        """
+        SELECT COUNT(*) FILTER (WHERE status = 'succeeded'), COUNT(*)
+        FROM runs
+        WHERE session_id = ?
+        """,
+        (session_id,),
+    ).fetchone()
+    assert succeeded == total == 2
 
 
 @pytest.mark.anyio
 async def test_strict_profile_rejects_write_apply_outside_docker(
     client: AsyncClient,
-    database_path: Path,
+    verify_connection: sqlite3.Connection,
     data_root: Path,
     monkeypatch,
 ) -> None:
     monkeypatch.setattr("calt.daemon.api.is_running_in_docker", lambda: False)
-    session_id = await _create_session(client, safety_profile="strict")
-    workspace_root = data_root / "sessions" / session_id / "workspace"
-    expected_preview = write_file_preview(workspace_root, "memo.txt", "after\n")
-
-    plan_payload = {
-        "version": 1,
-        "title": "strict docker guard reject",
-        "session_goal": "strict rejects apply outside docker",
-        "steps": [
-            {
-                "id": "step_preview",
-                "title": "preview write",
-                "tool": "write_file_preview",
-                "inputs": {"path": "memo.txt", "content": "after\n"},
-                "timeout_sec": 30,
-            },
-            {
-                "id": "step_apply",
-                "title": "apply write",
-                "tool": "write_file_apply",
-                "inputs": {
-                    "path": "memo.txt",
-                    "content": "after\n",
-                    "preview": expected_preview,
-                },
-                "timeout_sec": 30,
-            },
-        ],
-    }
-    await _import_plan(client, session_id, plan_payload)
-    await _approve_plan(client, session_id)
-    await _approve_step(client, session_id, "step_preview")
-    await _approve_step(client, session_id, "step_apply")
-
-    preview_execute = await client.post(
-        f"/api/v1/sessions/{session_id}/steps/step_preview/execute",
-        headers=AUTH_HEADERS,
+    session_id, _ = await _run_write_preview(
+        client,
+        data_root,
+        title="strict docker guard reject",
+        safety_profile="strict",
     )
-    assert preview_execute.status_code == 200
-    assert preview_execute.json()["status"] == "succeeded"
 
     apply_execute = await client.post(
         f"/api/v1/sessions/{session_id}/steps/step_apply/execute",
@@ -315,76 +256,37 @@ async def test_strict_profile_rejects_write_apply_outside_docker(
     assert apply_execute.status_code == 409
     assert "docker required" in apply_execute.json()["detail"]
 
-    connection = sqlite3.connect(database_path)
-    connection.row_factory = sqlite3.Row
-    try:
-        event_row = connection.execute(
-            """
-            SELECT payload_text
-            FROM events
-            WHERE session_id = ? AND event_type = 'step_execution_rejected'
-            ORDER BY id DESC
-            LIMIT 1
-            """,
-            (session_id,),
-        ).fetchone()
-        assert event_row is not None
-        payload_text = event_row["payload_text"] or ""
-        assert "docker_required_for_strict_apply" in payload_text
-        assert '"guard_reason": "docker_required"' in payload_text
-        assert '"safety_profile": "strict"' in payload_text
-    finally:
-        connection.close()
+    event_row = verify_connection.execute(
+        """
+        SELECT payload_text
+        FROM events
+        WHERE session_id = ? AND event_type = 'step_execution_rejected'
+        ORDER BY id DESC
+        LIMIT 1
+        """,
+        (session_id,),
+    ).fetchone()
+    assert event_row is not None
+    payload_text = event_row[0] or ""
+    assert "docker_required_for_strict_apply" in payload_text
+    assert '"guard_reason": "docker_required"' in payload_text
+    assert '"safety_profile": "strict"' in payload_text
 
 
 @pytest.mark.anyio
 async def test_dev_profile_allows_write_apply_outside_docker_with_warning(
     client: AsyncClient,
-    database_path: Path,
+    verify_connection: sqlite3.Connection,
     data_root: Path,
     monkeypatch,
 ) -> None:
     monkeypatch.setattr("calt.daemon.api.is_running_in_docker", lambda: False)
-    session_id = await _create_session(client, safety_profile="dev")
-    workspace_root = data_root / "sessions" / session_id / "workspace"
-    expected_preview = write_file_preview(workspace_root, "memo.txt", "after\n")
-
-    plan_payload = {
-        "version": 1,
-        "title": "dev docker guard warning",
-        "session_goal": "dev allows apply outside docker",
-        "steps": [
-            {
-                "id": "step_preview",
-                "title": "preview write",
-                "tool": "write_file_preview",
-                "inputs": {"path": "memo.txt", "content": "after\n"},
-                "timeout_sec": 30,
-            },
-            {
-                "id": "step_apply",
-                "title": "apply write",
-                "tool": "write_file_apply",
-                "inputs": {
-                    "path": "memo.txt",
-                    "content": "after\n",
-                    "preview": expected_preview,
-                },
-                "timeout_sec": 30,
-            },
-        ],
-    }
-    await _import_plan(client, session_id, plan_payload)
-    await _approve_plan(client, session_id)
-    await _approve_step(client, session_id, "step_preview")
-    await _approve_step(client, session_id, "step_apply")
-
-    preview_execute = await client.post(
-        f"/api/v1/sessions/{session_id}/steps/step_preview/execute",
-        headers=AUTH_HEADERS,
+    session_id, workspace_root = await _run_write_preview(
+        client,
+        data_root,
+        title="dev docker guard warning",
+        safety_profile="dev",
     )
-    assert preview_execute.status_code == 200
-    assert preview_execute.json()["status"] == "succeeded"
 
     apply_execute = await client.post(
         f"/api/v1/sessions/{session_id}/steps/step_apply/execute",
@@ -396,26 +298,21 @@ async def test_dev_profile_allows_write_apply_outside_docker_with_warning(
     assert apply_payload["output"]["applied"] is True
     assert (workspace_root / "memo.txt").read_text(encoding="utf-8") == "after\n"
 
-    connection = sqlite3.connect(database_path)
-    connection.row_factory = sqlite3.Row
-    try:
-        event_row = connection.execute(
-            """
-            SELECT payload_text
-            FROM events
-            WHERE session_id = ? AND event_type = 'step_execution_warning'
-            ORDER BY id DESC
-            LIMIT 1
-            """,
-            (session_id,),
-        ).fetchone()
-        assert event_row is not None
-        payload_text = event_row["payload_text"] or ""
-        assert "docker_not_detected_dev_allows_apply" in payload_text
-        assert '"guard_reason": "docker_not_detected_dev_allowed"' in payload_text
-        assert '"safety_profile": "dev"' in payload_text
-    finally:
-        connection.close()
+    event_row = verify_connection.execute(
+        """
+        SELECT payload_text
+        FROM events
+        WHERE session_id = ? AND event_type = 'step_execution_warning'
+        ORDER BY id DESC
+        LIMIT 1
+        """,
+        (session_id,),
+    ).fetchone()
+    assert event_row is not None
+    payload_text = event_row[0] or ""
+    assert "docker_not_detected_dev_allows_apply" in payload_text
+    assert '"guard_reason": "docker_not_detected_dev_allowed"' in payload_text
+    assert '"safety_profile": "dev"' in payload_text
 
 
 @pytest.mark.anyio
@@ -440,8 +337,7 @@ async def test_strict_profile_allows_readonly_step_outside_docker(
         ],
     }
     await _import_plan(client, session_id, plan_payload)
-    await _approve_plan(client, session_id)
-    await _approve_step(client, session_id, "step_list")
+    await _approve_plan_and_steps(client, session_id, "step_list")
 
     execute = await client.post(
         f"/api/v1/sessions/{session_id}/steps/step_list/execute",
@@ -456,45 +352,12 @@ async def test_dry_run_allows_preview_and_rejects_write_apply(
     client: AsyncClient,
     data_root: Path,
 ) -> None:
-    session_id = await _create_session(client, mode="dry_run")
-    workspace_root = data_root / "sessions" / session_id / "workspace"
-    expected_preview = write_file_preview(workspace_root, "memo.txt", "after\n")
-    plan_payload = {
-        "version": 1,
-        "title": "dry run write apply guard",
-        "session_goal": "dry run blocks write apply",
-        "steps": [
-            {
-                "id": "step_preview",
-                "title": "preview write",
-                "tool": "write_file_preview",
-                "inputs": {"path": "memo.txt", "content": "after\n"},
-                "timeout_sec": 30,
-            },
-            {
-                "id": "step_apply",
-                "title": "apply write",
-                "tool": "write_file_apply",
-                "inputs": {
-                    "path": "memo.txt",
-                    "content": "after\n",
-                    "preview": expected_preview,
-                },
-                "timeout_sec": 30,
-            },
-        ],
-    }
-    await _import_plan(client, session_id, plan_payload)
-    await _approve_plan(client, session_id)
-    await _approve_step(client, session_id, "step_preview")
-    await _approve_step(client, session_id, "step_apply")
-
-    preview_execute = await client.post(
-        f"/api/v1/sessions/{session_id}/steps/step_preview/execute",
-        headers=AUTH_HEADERS,
+    session_id, _ = await _run_write_preview(
+        client,
+        data_root,
+        title="dry run write apply guard",
+        mode="dry_run",
     )
-    assert preview_execute.status_code == 200
-    assert preview_execute.json()["status"] == "succeeded"
 
     apply_execute = await client.post(
         f"/api/v1/sessions/{session_id}/steps/step_apply/execute",
@@ -542,9 +405,7 @@ async def test_dry_run_allows_patch_preview_and_rejects_patch_apply(
         ],
     }
     await _import_plan(client, session_id, plan_payload)
-    await _approve_plan(client, session_id)
-    await _approve_step(client, session_id, "step_patch_preview")
-    await _approve_step(client, session_id, "step_patch_apply")
+    await _approve_plan_and_steps(client, session_id, "step_patch_preview", "step_patch_apply")
 
     preview_execute = await client.post(
         f"/api/v1/sessions/{session_id}/steps/step_patch_preview/execute",
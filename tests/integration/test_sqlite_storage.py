@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import re
 import sqlite3
 from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
-from calt.storage import connect_sqlite, initialize_storage
+from calt.storage import (
+    SCHEMA_VERSION,
+    SQLiteConnectionPool,
+    connect_sqlite,
+    initialize_storage,
+)
 
 REQUIRED_TABLES = {
     "sessions",
@@ -27,14 +33,22 @@ REQUIRED_VIEWS = {
 }
 
 
-@pytest.fixture
-def conn() -> Iterator[sqlite3.Connection]:
+@pytest.fixture(scope="session")
+def template_conn() -> Iterator[sqlite3.Connection]:
     connection = connect_sqlite(":memory:")
     initialize_storage(connection)
     yield connection
     connection.close()
 
 
+@pytest.fixture
+def conn(template_conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    connection = connect_sqlite(":memory:")
+    template_conn.backup(connection)
+    yield connection
+    connection.close()
+
+
 def _exists(conn: sqlite3.Connection, *, name: str, object_type: str) -> bool:
     row = conn.execute(
         "SELECT 1 FROM sqlite_master WHERE type = ? AND name = ?",
@@ -43,6 +57,15 @@ def _exists(conn: sqlite3.Connection, *, name: str, object_type: str) -> bool:
     return row is not None
 
 
+def _existing(conn: sqlite3.Connection, *, names: set[str], object_type: str) -> set[str]:
+    placeholders = ", ".join("?" * len(names))
+    rows = conn.execute(
+        f"SELECT name FROM sqlite_master WHERE type = ? AND name IN ({placeholders})",
+        (object_type, *names),
+    ).fetchall()
+    return {row["name"] for row in rows}
+
+
 def _insert_session(conn: sqlite3.Connection, session_id: str = "sess_1") -> None:
     conn.execute(
         "INSERT INTO sessions (id, goal, status) VALUES (?, ?, ?)",
@@ -51,14 +74,22 @@ def _insert_session(conn: sqlite3.Connection, session_id: str = "sess_1") -> Non
 
 
 def test_initialize_storage_creates_required_tables(conn: sqlite3.Connection) -> None:
+    assert _existing(conn, names=REQUIRED_TABLES, object_type="table") == REQUIRED_TABLES
+
+
+def test_initialize_storage_records_schema_version_and_skips_reapplying(
+    conn: sqlite3.Connection,
+) -> None:
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+    conn.execute("DROP VIEW v_session_failure_reasons")
     initialize_storage(conn)
-    for table_name in REQUIRED_TABLES:
-        assert _exists(conn, name=table_name, object_type="table")
+
+    assert not _exists(conn, name="v_session_failure_reasons", object_type="view")
 
 
 def test_initialize_storage_creates_required_views(conn: sqlite3.Connection) -> None:
-    for view_name in REQUIRED_VIEWS:
-        assert _exists(conn, name=view_name, object_type="view")
+    assert _existing(conn, names=REQUIRED_VIEWS, object_type="view") == REQUIRED_VIEWS
 
 
 def test_events_fts_search_hits_inserted_event(conn: sqlite3.Connection) -> None:
@@ -80,6 +111,61 @@ def test_events_fts_search_hits_inserted_event(conn: sqlite3.Connection) -> None
     assert rows[0]["rowid"] == 1
 
 
+def test_events_fts_match_stays_on_full_text_index_when_joined(
+    conn: sqlite3.Connection,
+) -> None:
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT events.id FROM events "
+        "JOIN events_fts ON events.id = events_fts.rowid "
+        "WHERE events_fts MATCH ? AND events.session_id = ?",
+        ("completed", "sess_1"),
+    ).fetchall()
+
+    # FTS5 reports a consumed MATCH constraint as "M" in its index string; a bare
+    # "INDEX 0:" would mean the virtual table is scanned in full.
+    fts_details = [row["detail"] for row in plan if "VIRTUAL TABLE" in row["detail"]]
+    assert fts_details
+    assert all(re.search(r"VIRTUAL TABLE INDEX \d+:\S*M", detail) for detail in fts_details)
+
+
+def test_initialize_storage_rebuilds_legacy_events_fts_without_docsize(
+    tmp_path: Path,
+) -> None:
+    connection = connect_sqlite(tmp_path / "legacy_fts.sqlite3")
+    try:
+        initialize_storage(connection)
+        connection.executescript(
+            """
+            DROP TABLE events_fts;
+            CREATE VIRTUAL TABLE events_fts USING fts5(
+                summary,
+                payload_text,
+                content = 'events',
+                content_rowid = 'id'
+            );
+            PRAGMA user_version = 1;
+            """
+        )
+        _insert_session(connection)
+        connection.execute(
+            "INSERT INTO events (session_id, event_type, summary, payload_text) VALUES (?, ?, ?, ?)",
+            ("sess_1", "tool_result", "legacy summary", "indexed before upgrade"),
+        )
+        assert _exists(connection, name="events_fts_docsize", object_type="table")
+
+        initialize_storage(connection)
+
+        assert connection.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        assert not _exists(connection, name="events_fts_docsize", object_type="table")
+        rows = connection.execute(
+            "SELECT rowid FROM events_fts WHERE events_fts MATCH ?",
+            ("upgrade",),
+        ).fetchall()
+        assert [row["rowid"] for row in rows] == [1]
+    finally:
+        connection.close()
+
+
 def test_events_table_is_append_only(conn: sqlite3.Connection) -> None:
     _insert_session(conn)
     conn.execute(
@@ -109,6 +195,55 @@ def test_connect_sqlite_creates_parent_directory_when_missing(tmp_path: Path) ->
         connection.close()
 
 
+def test_connect_sqlite_applies_connection_pragmas(tmp_path: Path) -> None:
+    connection = connect_sqlite(tmp_path / "wal.sqlite3")
+    try:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert connection.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert connection.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        assert connection.execute("PRAGMA temp_store").fetchone()[0] == 2
+        assert connection.execute("PRAGMA cache_size").fetchone()[0] == -65536
+    finally:
+        connection.close()
+
+
+def test_connection_pool_reuses_connections_and_rolls_back_open_transactions(
+    tmp_path: Path,
+) -> None:
+    database_path = tmp_path / "pool.sqlite3"
+    init_connection = connect_sqlite(database_path)
+    initialize_storage(init_connection)
+    init_connection.close()
+
+    pool = SQLiteConnectionPool(database_path, size=1)
+    try:
+        with pool.connection() as first:
+            assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            first.execute("BEGIN IMMEDIATE")
+            _insert_session(first)
+            assert first.in_transaction
+
+        with pool.connection() as second:
+            assert second is first
+            assert not second.in_transaction
+            assert second.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 0
+    finally:
+        pool.close()
+
+
+def test_connection_pool_raises_timeout_when_exhausted(tmp_path: Path) -> None:
+    pool = SQLiteConnectionPool(tmp_path / "exhausted.sqlite3", size=1)
+    try:
+        with pool.connection():
+            with pytest.raises(TimeoutError):
+                with pool.connection(timeout=0.01):
+                    pass
+        with pool.connection(timeout=0.01) as connection:
+            assert connection.execute("SELECT 1").fetchone()[0] == 1
+    finally:
+        pool.close()
+
+
 def test_initialize_storage_adds_mode_and_safety_profile_columns_for_legacy_sessions_table() -> None:
     connection = connect_sqlite(":memory:")
     try:
@@ -131,3 +266,71 @@ def test_initialize_storage_adds_mode_and_safety_profile_columns_for_legacy_sess
         assert "safety_profile" in columns
     finally:
         connection.close()
+
+
+def test_connect_sqlite_leaves_transaction_control_to_callers(tmp_path: Path) -> None:
+    connection = connect_sqlite(tmp_path / "autocommit.sqlite3")
+    try:
+        initialize_storage(connection)
+        _insert_session(connection)
+        assert not connection.in_transaction
+
+        connection.execute("BEGIN IMMEDIATE")
+        _insert_session(connection, "sess_2")
+        assert connection.in_transaction
+        connection.rollback()
+
+        session_ids = [row["id"] for row in connection.execute("SELECT id FROM sessions")]
+        assert session_ids == ["sess_1"]
+    finally:
+        connection.close()
+
+
+def test_initialize_storage_creates_hot_path_indexes(conn: sqlite3.Connection) -> None:
+    index_names = {
+        "idx_steps_plan_status",
+        "idx_approvals_session_type_plan_step",
+        "idx_events_session_id",
+        "idx_artifacts_session_id",
+    }
+    assert _existing(conn, names=index_names, object_type="index") == index_names
+
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM steps WHERE plan_id = ? AND status != ?",
+        (1, "succeeded"),
+    ).fetchall()
+    assert any("idx_steps_plan_status" in row["detail"] for row in plan)
+
+
+def test_read_only_connection_pool_sees_commits_and_rejects_writes(tmp_path: Path) -> None:
+    database_path = tmp_path / "readers.sqlite3"
+    writer = connect_sqlite(database_path)
+    initialize_storage(writer)
+
+    pool = SQLiteConnectionPool(database_path, size=2, read_only=True)
+    try:
+        _insert_session(writer)
+        with pool.connection() as reader:
+            assert reader.execute("PRAGMA query_only").fetchone()[0] == 1
+            assert reader.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 1
+            with pytest.raises(sqlite3.OperationalError, match="readonly"):
+                _insert_session(reader, "sess_2")
+    finally:
+        pool.close()
+        writer.close()
+
+
+def test_connect_sqlite_opens_shared_in_memory_uri() -> None:
+    database_uri = "file:memdb_storage_test?mode=memory&cache=shared"
+    writer = connect_sqlite(database_uri)
+    reader = connect_sqlite(database_uri, read_only=True)
+    try:
+        initialize_storage(writer)
+        _insert_session(writer)
+
+        assert reader.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 1
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            _insert_session(reader, "sess_2")
+    finally:
+        reader.close()
+        writer.close()
@@ -1,40 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
 from pathlib import Path
 
 import pytest
-from httpx import ASGITransport, AsyncClient
-
-from calt.daemon import create_app
+from httpx import AsyncClient
 
 AUTH_HEADERS = {"Authorization": "Bearer test-token"}
 
 
-@pytest.fixture
-def database_path(tmp_path: Path) -> Path:
-    return tmp_path / "daemon.sqlite3"
-
-
-@pytest.fixture
-def data_root(tmp_path: Path) -> Path:
-    root = tmp_path / "data"
-    root.mkdir(parents=True, exist_ok=True)
-    return root
-
-
-@pytest.fixture
-def app(database_path: Path, data_root: Path):
-    return create_app(database_path, data_root=data_root)
-
-
-@pytest.fixture
-async def client(app) -> AsyncIterator[AsyncClient]:
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://testserver") as async_client:
-        yield async_client
-
-
 async def _create_session(
     client: AsyncClient,
     *,
@@ -59,22 +32,22 @@ async def _import_plan(client: AsyncClient, session_id: str, payload: dict[str,
     assert response.status_code == 200
 
 
-async def _approve_plan(client: AsyncClient, session_id: str, version: int = 1) -> None:
-    response = await client.post(
+async def _approve_plan_and_steps(
+    client: AsyncClient,
+    session_id: str,
+    *step_ids: str,
+    version: int = 1,
+) -> None:
+    # Sequential on purpose: concurrent writers on a shared-cache database fail with
+    # SQLITE_LOCKED instead of waiting on busy_timeout, and event order is asserted.
+    approval = {"approved_by": "user_1", "source": "integration"}
+    urls = [
         f"/api/v1/sessions/{session_id}/plans/{version}/approve",
-        headers=AUTH_HEADERS,
-        json={"approved_by": "user_1", "source": "integration"},
-    )
-    assert response.status_code == 200
-
-
-async def _approve_step(client: AsyncClient, session_id: str, step_id: str) -> None:
-    response = await client.post(
-        f"/api/v1/sessions/{session_id}/steps/{step_id}/approve",
-        headers=AUTH_HEADERS,
-        json={"approved_by": "user_1", "source": "integration"},
-    )
-    assert response.status_code == 200
+        *(f"/api/v1/sessions/{session_id}/steps/{step_id}/approve" for step_id in step_ids),
+    ]
+    for url in urls:
+        response = await client.post(url, headers=AUTH_HEADERS, json=approval)
+        assert response.status_code == 200
 
 
 @pytest.mark.anyio
@@ -125,10 +98,13 @@ async def test_step_output_reference_is_resolved_for_apply_and_field_path(
         ],
     }
     await _import_plan(client, session_id, plan_payload)
-    await _approve_plan(client, session_id)
-    await _approve_step(client, session_id, "step_preview")
-    await _approve_step(client, session_id, "step_apply")
-    await _approve_step(client, session_id, "step_read_back")
+    await _approve_plan_and_steps(
+        client,
+        session_id,
+        "step_preview",
+        "step_apply",
+        "step_read_back",
+    )
 
     preview_execute = await client.post(
         f"/api/v1/sessions/{session_id}/steps/step_preview/execute",
@@ -190,9 +166,7 @@ async def test_step_output_reference_returns_409_when_not_yet_available(
         ],
     }
     await _import_plan(client, session_id, plan_payload)
-    await _approve_plan(client, session_id)
-    await _approve_step(client, session_id, "step_preview")
-    await _approve_step(client, session_id, "step_apply")
+    await _approve_plan_and_steps(client, session_id, "step_preview", "step_apply")
 
     execute = await client.post(
         f"/api/v1/sessions/{session_id}/steps/step_apply/execute",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import subprocess
 from pathlib import Path
 
@@ -20,6 +21,8 @@ def _run_bootstrap(target_root: Path) -> subprocess.CompletedProcess[str]:
         capture_output=True,
         text=True,
         check=False,
+        # A minimal environment keeps the run hermetic (no BASH_ENV, no locale archive).
+        env={"PATH": os.environ["PATH"], "LC_ALL": "C"},
     )
 
 
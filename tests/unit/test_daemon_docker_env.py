@@ -28,3 +28,11 @@ def test_is_running_in_docker_false_without_markers(tmp_path: Path) -> None:
     cgroup.write_text("1:name=systemd:/user.slice\n", encoding="utf-8")
 
     assert is_running_in_docker(dockerenv_path=dockerenv, cgroup_path=cgroup) is False
+
+
+def test_is_running_in_docker_matches_markers_case_insensitively(tmp_path: Path) -> None:
+    dockerenv = tmp_path / ".dockerenv"
+    cgroup = tmp_path / "cgroup"
+    cgroup.write_text("0::/KubePods/besteffort/pod1234\n", encoding="utf-8")
+
+    assert is_running_in_docker(dockerenv_path=dockerenv, cgroup_path=cgroup) is True
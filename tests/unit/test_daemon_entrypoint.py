@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
+import pytest
+
+from calt.daemon import entrypoint
 from calt.daemon.entrypoint import build_daemon_settings, parse_daemon_settings
 
 
@@ -13,6 +17,8 @@ def test_parse_daemon_settings_defaults() -> None:
     assert settings.host == "127.0.0.1"
     assert settings.port == 8000
     assert settings.reload is False
+    assert settings.workers == 1
+    assert settings.loop == "auto"
 
 
 def test_parse_daemon_settings_custom_values(tmp_path: Path) -> None:
@@ -30,6 +36,10 @@ def test_parse_daemon_settings_custom_values(tmp_path: Path) -> None:
             "--port",
             "9001",
             "--reload",
+            "--workers",
+            "3",
+            "--loop",
+            "uvloop",
         ]
     )
 
@@ -38,6 +48,8 @@ def test_parse_daemon_settings_custom_values(tmp_path: Path) -> None:
     assert settings.host == "0.0.0.0"
     assert settings.port == 9001
     assert settings.reload is True
+    assert settings.workers == 3
+    assert settings.loop == "uvloop"
 
 
 def test_build_daemon_settings_keeps_data_root_optional() -> None:
@@ -51,3 +63,37 @@ def test_build_daemon_settings_keeps_data_root_optional() -> None:
 
     assert settings.db_path == (Path.cwd() / "relative.sqlite3").resolve()
     assert settings.data_root is None
+
+
+def test_parse_daemon_settings_reads_workers_from_web_concurrency(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("WEB_CONCURRENCY", "4")
+
+    assert parse_daemon_settings([]).workers == 4
+
+
+def test_run_uses_factory_import_string_for_multiple_workers(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_run(app: object, **kwargs: Any) -> None:
+        captured["app"] = app
+        captured.update(kwargs)
+
+    monkeypatch.setattr(entrypoint.uvicorn, "run", fake_run)
+    # Register both variables so run()'s environment writes are undone after the test.
+    monkeypatch.setenv(entrypoint.DB_PATH_ENV, "")
+    monkeypatch.setenv(entrypoint.DATA_ROOT_ENV, "")
+    db_path = tmp_path / "daemon.sqlite3"
+
+    entrypoint.run(["--db-path", str(db_path), "--workers", "2"])
+
+    assert captured["app"] == "calt.daemon.entrypoint:create_app_from_env"
+    assert captured["factory"] is True
+    assert captured["workers"] == 2
+    assert captured["loop"] == "auto"
+    assert entrypoint.create_app_from_env().title == "calt-daemon"
+    assert db_path.exists()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from calt.discord_bot import DiscordBotService
+from calt.discord_bot.bot import (
+    COMMAND_HASH_PATH_ENV,
+    MAX_REPLY_BODY_CHARS,
+    command_tree_hash,
+    create_bot,
+    format_reply_body,
+)
+
+
+def test_format_reply_body_renders_indented_json() -> None:
+    payload = {"session_id": "session-1", "goal": "日本語"}
+
+    body = format_reply_body(payload)
+
+    assert json.loads(body) == payload
+    assert '\n  "session_id": "session-1"' in body
+
+
+def test_format_reply_body_truncates_payloads_over_discord_limit() -> None:
+    payload = {"output": "x" * 5000}
+
+    body = format_reply_body(payload)
+
+    assert body.startswith('{\n  "output": "xxx')
+    assert body.endswith("\n... (truncated)")
+    assert len(body) <= MAX_REPLY_BODY_CHARS + len("\n... (truncated)")
+
+
+class _NullDaemonClient:
+    pass
+
+
+@pytest.mark.anyio
+async def test_setup_hook_syncs_commands_only_when_command_hash_changes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    hash_path = tmp_path / "state" / "command_hash"
+    service = DiscordBotService(client=_NullDaemonClient(), allowed_user_ids={42})
+    bot = create_bot(service, command_hash_path=hash_path)
+    sync_calls: list[None] = []
+
+    async def fake_sync() -> list[Any]:
+        sync_calls.append(None)
+        return []
+
+    monkeypatch.setattr(bot.tree, "sync", fake_sync)
+
+    await bot.setup_hook()
+    assert hash_path.read_text(encoding="utf-8").strip() == command_tree_hash(bot.tree)
+
+    await bot.setup_hook()
+    assert len(sync_calls) == 1
+
+    hash_path.write_text("stale\n", encoding="utf-8")
+    await bot.setup_hook()
+    assert len(sync_calls) == 2
+
+
+@pytest.mark.anyio
+async def test_setup_hook_defaults_command_hash_path_from_env(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    hash_path = tmp_path / "command_hash"
+    monkeypatch.setenv(COMMAND_HASH_PATH_ENV, str(hash_path))
+    service = DiscordBotService(client=_NullDaemonClient(), allowed_user_ids={42})
+    bot = create_bot(service)
+
+    async def fake_sync() -> list[Any]:
+        return []
+
+    monkeypatch.setattr(bot.tree, "sync", fake_sync)
+
+    await bot.setup_hook()
+    assert hash_path.read_text(encoding="utf-8").strip() == command_tree_hash(bot.tree)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any
 from unittest.mock import AsyncMock
@@ -116,3 +117,62 @@ async def test_calls_client_when_user_is_allowed(case: ServiceCallCase) -> None:
 
     assert result == expected
     getattr(client, case.client_method).assert_awaited_once_with(**case.expected_kwargs)
+
+
+@pytest.mark.anyio
+async def test_repeated_reads_are_served_from_cache_until_a_write() -> None:
+    client = MockDiscordDaemonClient()
+    client.get_plan.return_value = {"version": 3}
+    client.approve_step.return_value = {"approved": True}
+    service = _build_service(client)
+
+    first = await service.plan_show(user_id=42, session_id="session-1", version=3)
+    second = await service.plan_show(user_id=42, session_id="session-1", version=3)
+    assert first == second == {"version": 3}
+    client.get_plan.assert_awaited_once()
+
+    await service.step_approve(user_id=42, session_id="session-1", step_id="step_001")
+    await service.plan_show(user_id=42, session_id="session-1", version=3)
+    assert client.get_plan.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_reads_cached_during_a_slow_write_are_refetched_after_it() -> None:
+    client = MockDiscordDaemonClient()
+    artifacts = {"items": []}
+    client.list_artifacts.side_effect = lambda **_: dict(artifacts)
+    write_started = asyncio.Event()
+    finish_write = asyncio.Event()
+
+    async def slow_execute_step(**_: Any) -> dict[str, Any]:
+        write_started.set()
+        await finish_write.wait()
+        artifacts["items"] = ["run_1_1_output.json"]
+        return {"status": "succeeded"}
+
+    client.execute_step.side_effect = slow_execute_step
+    service = _build_service(client)
+
+    execute = asyncio.create_task(
+        service.step_execute(user_id=42, session_id="session-1", step_id="step_001")
+    )
+    await write_started.wait()
+    during = await service.artifacts_list(user_id=42, session_id="session-1")
+    finish_write.set()
+    await execute
+
+    after = await service.artifacts_list(user_id=42, session_id="session-1")
+    assert during == {"items": []}
+    assert after == {"items": ["run_1_1_output.json"]}
+
+
+@pytest.mark.anyio
+async def test_read_cache_can_be_disabled() -> None:
+    client = MockDiscordDaemonClient()
+    client.get_tool_permissions.return_value = {"tool_name": "read_file"}
+    service = DiscordBotService(client=client, allowed_user_ids={42}, read_cache_ttl_sec=0)
+
+    await service.tools_permissions(user_id=42, tool_name="read_file")
+    await service.tools_permissions(user_id=42, tool_name="read_file")
+
+    assert client.get_tool_permissions.await_count == 2
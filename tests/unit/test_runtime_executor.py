@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import json
+import threading
+import time
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 from calt.runtime import StepExecutor
 
 
-def test_step_executor_runs_readonly_tool_and_generates_artifact(tmp_path: Path) -> None:
+@pytest.mark.anyio
+async def test_step_executor_runs_readonly_tool_and_generates_artifact(tmp_path: Path) -> None:
     (tmp_path / "hello.txt").write_text("hello", encoding="utf-8")
 
-    result = StepExecutor().execute(
+    result = await StepExecutor().execute(
         tool="list_dir",
         inputs={"workspace_root": str(tmp_path), "path": "."},
         timeout=30,
@@ -20,10 +27,22 @@ def test_step_executor_runs_readonly_tool_and_generates_artifact(tmp_path: Path)
     assert result.output["path"] == "."
     assert len(result.artifacts) == 1
     assert result.artifacts[0].kind == "json"
+    assert json.loads(result.artifacts[0].payload) == result.output
+
+
+@pytest.mark.anyio
+async def test_step_executor_leaves_caller_inputs_untouched(tmp_path: Path) -> None:
+    inputs = {"workspace_root": str(tmp_path), "command": "ls"}
 
+    result = await StepExecutor().execute(tool="run_shell_readonly", inputs=inputs, timeout=5)
+
+    assert result.status == "succeeded"
+    assert inputs == {"workspace_root": str(tmp_path), "command": "ls"}
 
-def test_step_executor_returns_failed_for_unknown_tool(tmp_path: Path) -> None:
-    result = StepExecutor().execute(
+
+@pytest.mark.anyio
+async def test_step_executor_returns_failed_for_unknown_tool(tmp_path: Path) -> None:
+    result = await StepExecutor().execute(
         tool="unknown_tool",
         inputs={"workspace_root": str(tmp_path)},
         timeout=30,
@@ -35,8 +54,9 @@ def test_step_executor_returns_failed_for_unknown_tool(tmp_path: Path) -> None:
     assert result.artifacts == []
 
 
-def test_step_executor_rejects_write_file_apply_without_preview(tmp_path: Path) -> None:
-    result = StepExecutor().execute(
+@pytest.mark.anyio
+async def test_step_executor_rejects_write_file_apply_without_preview(tmp_path: Path) -> None:
+    result = await StepExecutor().execute(
         tool="write_file_apply",
         inputs={
             "workspace_root": str(tmp_path),
@@ -52,7 +72,8 @@ def test_step_executor_rejects_write_file_apply_without_preview(tmp_path: Path)
     assert result.artifacts == []
 
 
-def test_step_executor_rejects_apply_patch_apply_without_preview(tmp_path: Path) -> None:
+@pytest.mark.anyio
+async def test_step_executor_rejects_apply_patch_apply_without_preview(tmp_path: Path) -> None:
     (tmp_path / "memo.txt").write_text("before\n", encoding="utf-8")
     patch = """--- a/memo.txt
 +++ b/memo.txt
@@ -61,7 +82,7 @@ def test_step_executor_rejects_apply_patch_apply_without_preview(tmp_path: Path)
 +after
 """
 
-    result = StepExecutor().execute(
+    result = await StepExecutor().execute(
         tool="apply_patch",
         inputs={
             "workspace_root": str(tmp_path),
@@ -75,3 +96,49 @@ def test_step_executor_rejects_apply_patch_apply_without_preview(tmp_path: Path)
     assert "preview is required for apply_patch mode=apply" in (result.error or "")
     assert result.output is None
     assert result.artifacts == []
+
+
+@pytest.mark.anyio
+async def test_step_executor_reuses_pooled_worker_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    executor = StepExecutor(max_workers=1)
+    thread_names: list[str] = []
+
+    def fake_invoke(tool: str, inputs: dict[str, Any], timeout: int) -> dict[str, Any]:
+        thread_names.append(threading.current_thread().name)
+        return {"tool": tool}
+
+    monkeypatch.setattr(executor, "_invoke", fake_invoke)
+    try:
+        for _ in range(3):
+            result = await executor.execute(tool="list_dir", inputs={}, timeout=30)
+            assert result.status == "succeeded"
+    finally:
+        executor.close()
+
+    assert len(set(thread_names)) == 1
+    assert thread_names[0].startswith("calt-step")
+
+
+@pytest.mark.anyio
+async def test_step_executor_times_out_without_waiting_for_the_tool(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    release = threading.Event()
+    executor = StepExecutor(max_workers=1)
+
+    def slow_invoke(tool: str, inputs: dict[str, Any], timeout: int) -> dict[str, Any]:
+        release.wait(5)
+        return {}
+
+    monkeypatch.setattr(executor, "_invoke", slow_invoke)
+    try:
+        started = time.monotonic()
+        result = await executor.execute(tool="list_dir", inputs={}, timeout=1)
+        elapsed = time.monotonic() - started
+    finally:
+        release.set()
+        executor.close()
+
+    assert result.status == "failed"
+    assert result.error == "tool timeout after 1s"
+    assert elapsed < 3
@@ -1,6 +1,10 @@
+import os
+import subprocess
+import time
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from calt.tools import (
     LIST_DIR_TOOL,
@@ -15,6 +19,7 @@ from calt.tools import (
     read_file,
     run_shell_readonly,
 )
+from calt.tools.readonly import MAX_OUTPUT_BYTES
 
 
 @pytest.mark.parametrize(
@@ -26,6 +31,8 @@ from calt.tools import (
         "find . -maxdepth 1",
         "git status --short",
         "git diff --stat",
+        "rg 'two words' src",
+        "git\tstatus",
         "python -m pytest -q tests/unit",
     ],
 )
@@ -38,8 +45,11 @@ def test_is_allowlisted_command_accepts_configured_commands(command: str) -> Non
     [
         "",
         "echo hello",
+        "git",
         "git log --oneline",
         "python -m pytest tests/unit",
+        "'git status'",
+        "rg 'unterminated",
     ],
 )
 def test_is_allowlisted_command_rejects_other_commands(command: str) -> None:
@@ -61,6 +71,27 @@ def test_read_file_rejects_path_outside_workspace(tmp_path: Path) -> None:
         read_file(ReadFileInput(workspace_root=str(tmp_path), path="../secret.txt"))
 
 
+def test_read_file_rejects_sibling_directory_sharing_name_prefix(tmp_path: Path) -> None:
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    sibling = tmp_path / "workspace-other"
+    sibling.mkdir()
+    (sibling / "secret.txt").write_text("secret", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="workspace_root"):
+        read_file(ReadFileInput(workspace_root=str(workspace), path="../workspace-other/secret.txt"))
+
+
+def test_read_file_rejects_symlink_escaping_workspace(tmp_path: Path) -> None:
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    (tmp_path / "secret.txt").write_text("secret", encoding="utf-8")
+    (workspace / "link.txt").symlink_to(tmp_path / "secret.txt")
+
+    with pytest.raises(ValueError, match="workspace_root"):
+        read_file(ReadFileInput(workspace_root=str(workspace), path="link.txt"))
+
+
 def test_list_dir_returns_sorted_entries(tmp_path: Path) -> None:
     (tmp_path / "b.txt").write_text("b", encoding="utf-8")
     (tmp_path / "a").mkdir()
@@ -82,6 +113,31 @@ def test_run_shell_readonly_runs_allowlisted_command(tmp_path: Path) -> None:
     assert "sample.txt" in result.stdout
 
 
+def test_run_shell_readonly_truncates_large_output(tmp_path: Path) -> None:
+    (tmp_path / "large.log").write_bytes(b"x" * (MAX_OUTPUT_BYTES + 10))
+
+    result = run_shell_readonly(
+        RunShellReadonlyInput(workspace_root=str(tmp_path), command="cat large.log")
+    )
+
+    assert result.exit_code == 0
+    assert result.truncated is True
+    assert len(result.stdout) == MAX_OUTPUT_BYTES
+
+
+def test_run_shell_readonly_kills_command_on_timeout(tmp_path: Path) -> None:
+    # Opening a FIFO with no writer blocks forever, which stands in for a hung command.
+    os.mkfifo(tmp_path / "pipe")
+    started = time.monotonic()
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        run_shell_readonly(
+            RunShellReadonlyInput(workspace_root=str(tmp_path), command="cat pipe", timeout_sec=1)
+        )
+
+    assert time.monotonic() - started < 5
+
+
 def test_run_shell_readonly_rejects_non_allowlisted_command(tmp_path: Path) -> None:
     with pytest.raises(ValueError, match="allowlisted"):
         run_shell_readonly(
@@ -98,3 +154,8 @@ def test_tool_definitions_expose_permission_profiles_and_models(tmp_path: Path)
     assert READ_FILE_TOOL.permission_profile == PermissionProfile.workspace_read
     assert LIST_DIR_TOOL.permission_profile == PermissionProfile.workspace_read
     assert RUN_SHELL_READONLY_TOOL.permission_profile == PermissionProfile.shell_readonly
+
+
+def test_tool_definitions_reject_unknown_input_fields(tmp_path: Path) -> None:
+    with pytest.raises(ValidationError, match="pth"):
+        READ_FILE_TOOL.invoke({"workspace_root": str(tmp_path), "pth": "memo.txt"})
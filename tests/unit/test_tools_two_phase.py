@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+import difflib
+import hashlib
+import os
+import stat
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from calt.tools import (
+    PatchApplyError,
+    PatchFormatError,
     PreviewMismatchError,
     WorkspaceBoundaryError,
     apply_patch,
     write_file_apply,
     write_file_preview,
 )
+from calt.tools.write_ops import MMAP_READ_THRESHOLD_BYTES
 
 
 def _create_workspace(tmp_path: Path) -> Path:
@@ -32,6 +40,16 @@ def test_write_file_preview_is_non_destructive(tmp_path: Path) -> None:
     assert target.read_text(encoding="utf-8") == "before\n"
 
 
+def test_write_file_preview_reports_sha256_digests(tmp_path: Path) -> None:
+    workspace = _create_workspace(tmp_path)
+    (workspace / "memo.txt").write_text("before\n", encoding="utf-8")
+
+    preview = write_file_preview(workspace, "memo.txt", "after\n")
+
+    assert preview["old_sha256"] == hashlib.sha256(b"before\n").hexdigest()
+    assert preview["new_sha256"] == hashlib.sha256(b"after\n").hexdigest()
+
+
 def test_write_file_apply_writes_content_after_preview(tmp_path: Path) -> None:
     workspace = _create_workspace(tmp_path)
     target = workspace / "memo.txt"
@@ -109,3 +127,208 @@ def test_write_file_apply_rejects_mismatched_preview(tmp_path: Path) -> None:
 
     with pytest.raises(PreviewMismatchError):
         write_file_apply(workspace, "memo.txt", "after\n", preview=wrong_preview)
+
+
+def test_write_file_preview_reports_no_op_write_without_diff(tmp_path: Path) -> None:
+    workspace = _create_workspace(tmp_path)
+    (workspace / "memo.txt").write_text("same\n", encoding="utf-8")
+
+    preview = write_file_preview(workspace, "memo.txt", "same\n")
+
+    assert preview["changed"] is False
+    assert preview["diff"] == ""
+    assert preview["old_sha256"] == preview["new_sha256"]
+
+
+@pytest.mark.parametrize(
+    ("before", "after"),
+    [
+        ("", "one\n"),
+        ("", "one\ntwo\n\nfour\n"),
+        ("", "\n"),
+        ("one\n", ""),
+        ("one\ntwo\n", ""),
+        ("a\nb\nc\nd\ne\nf\ng\nh\ni\nj\n", "a\nB\nc\nd\ne\nf\ng\nh\nI\nj\nk\n"),
+        ("".join(f"line {n}\n" for n in range(40)), "".join(f"line {n}\n" for n in range(5, 45))),
+    ],
+)
+def test_write_file_preview_diff_matches_difflib_unified_diff(
+    tmp_path: Path,
+    before: str,
+    after: str,
+) -> None:
+    workspace = _create_workspace(tmp_path)
+    (workspace / "memo.txt").write_text(before, encoding="utf-8")
+
+    preview = write_file_preview(workspace, "memo.txt", after)
+
+    expected = "\n".join(
+        difflib.unified_diff(
+            before.splitlines(),
+            after.splitlines(),
+            fromfile="a/memo.txt",
+            tofile="b/memo.txt",
+            lineterm="",
+        )
+    )
+    assert preview["diff"] == expected
+
+
+@pytest.mark.parametrize(
+    "hunk_header",
+    ["@@ -1 @@", "@@ -x +1 @@", "@@ -1,2 +1,", "@@ -1, +1 @@", "@@ - 1 +1 @@"],
+)
+def test_apply_patch_rejects_invalid_hunk_header(tmp_path: Path, hunk_header: str) -> None:
+    workspace = _create_workspace(tmp_path)
+    (workspace / "patch_target.txt").write_text("before\n", encoding="utf-8")
+    patch = f"--- a/patch_target.txt\n+++ b/patch_target.txt\n{hunk_header}\n-before\n+after\n"
+
+    with pytest.raises(PatchFormatError, match="invalid hunk header"):
+        apply_patch(workspace, patch, mode="preview")
+
+
+def test_apply_patch_accepts_hunk_header_with_section_heading(tmp_path: Path) -> None:
+    workspace = _create_workspace(tmp_path)
+    (workspace / "patch_target.txt").write_text("keep\nbefore\n", encoding="utf-8")
+    patch = """--- a/patch_target.txt
++++ b/patch_target.txt
+@@ -2,1 +2,1 @@ def section():
+-before
++after
+"""
+
+    result = apply_patch(workspace, patch, mode="apply")
+
+    assert (workspace / "patch_target.txt").read_text(encoding="utf-8") == "keep\nafter\n"
+    assert result["applied"] is True
+
+
+def test_apply_patch_applies_multiple_hunks(tmp_path: Path) -> None:
+    workspace = _create_workspace(tmp_path)
+    target = workspace / "patch_target.txt"
+    target.write_text("".join(f"line {n}\n" for n in range(1, 11)), encoding="utf-8")
+    patch = """diff --git a/patch_target.txt b/patch_target.txt
+--- a/patch_target.txt
++++ b/patch_target.txt
+@@ -1,2 +1,2 @@
+-line 1
++LINE 1
+ line 2
+@@ -9,2 +9,3 @@
+ line 9
+ line 10
++line 11
+"""
+
+    apply_patch(workspace, patch, mode="apply")
+
+    lines = target.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "LINE 1"
+    assert lines[-2:] == ["line 10", "line 11"]
+    assert len(lines) == 11
+
+
+def test_apply_patch_rejects_stale_context(tmp_path: Path) -> None:
+    workspace = _create_workspace(tmp_path)
+    (workspace / "patch_target.txt").write_text("one\ntwo\nthree\n", encoding="utf-8")
+    patch = """--- a/patch_target.txt
++++ b/patch_target.txt
+@@ -1,3 +1,3 @@
+ one
+ TWO
+-three
++3
+"""
+
+    with pytest.raises(PatchApplyError, match="context line does not match"):
+        apply_patch(workspace, patch, mode="preview")
+
+
+@pytest.mark.parametrize("line_count", [3, MMAP_READ_THRESHOLD_BYTES // 8])
+def test_write_file_preview_reads_existing_file_with_universal_newlines(
+    tmp_path: Path,
+    line_count: int,
+) -> None:
+    workspace = _create_workspace(tmp_path)
+    lines = [f"row {n:03d}" for n in range(line_count)]
+    (workspace / "memo.txt").write_bytes("\r\n".join(lines).encode("utf-8") + b"\r")
+
+    preview = write_file_preview(workspace, "memo.txt", "\n".join(lines) + "\n")
+
+    assert preview["changed"] is False
+    assert preview["diff"] == ""
+
+
+def test_write_file_apply_replaces_file_and_keeps_permissions(tmp_path: Path) -> None:
+    workspace = _create_workspace(tmp_path)
+    target = workspace / "run.sh"
+    target.write_text("echo before\n", encoding="utf-8")
+    target.chmod(0o750)
+
+    write_file_apply(workspace, "run.sh", "echo after\n")
+
+    assert target.read_text(encoding="utf-8") == "echo after\n"
+    assert stat.S_IMODE(target.stat().st_mode) == 0o750
+    assert sorted(path.name for path in workspace.iterdir()) == ["run.sh"]
+
+
+def test_write_file_preview_hashes_large_contents_correctly(tmp_path: Path) -> None:
+    workspace = _create_workspace(tmp_path)
+    before = "old line\n" * (1024 * 1024 // 9 + 1)
+    after = before + "new line\n"
+    (workspace / "big.txt").write_text(before, encoding="utf-8")
+
+    preview = write_file_preview(workspace, "big.txt", after)
+
+    assert preview["old_sha256"] == hashlib.sha256(before.encode("utf-8")).hexdigest()
+    assert preview["new_sha256"] == hashlib.sha256(after.encode("utf-8")).hexdigest()
+    assert preview["diff"].endswith("\n+new line")
+
+
+def test_write_file_preview_skips_reading_unchanged_settled_file(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    workspace = _create_workspace(tmp_path)
+    target = workspace / "settled.txt"
+    target.write_text("same\n", encoding="utf-8")
+    os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+    first = write_file_preview(workspace, "settled.txt", "same\n")
+
+    opened: list[Path] = []
+    original_open = Path.open
+
+    def tracking_open(self: Path, *args: Any, **kwargs: Any) -> Any:
+        opened.append(self)
+        return original_open(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", tracking_open)
+    second = write_file_preview(workspace, "settled.txt", "same\n")
+    changed = write_file_preview(workspace, "settled.txt", "different\n")
+
+    assert second == first
+    assert opened == [target]
+    assert changed["changed"] is True
+    assert changed["old_sha256"] == first["old_sha256"]
+    assert "-same" in changed["diff"]
+
+
+def test_write_file_preview_rejects_symlink_escaping_workspace(tmp_path: Path) -> None:
+    workspace = _create_workspace(tmp_path)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (workspace / "link").symlink_to(outside, target_is_directory=True)
+
+    with pytest.raises(WorkspaceBoundaryError):
+        write_file_preview(workspace, "link/escape.txt", "x")
+    with pytest.raises(WorkspaceBoundaryError):
+        write_file_preview(workspace, str(outside / "absolute.txt"), "x")
+
+
+def test_write_file_preview_reports_canonical_workspace_path(tmp_path: Path) -> None:
+    workspace = _create_workspace(tmp_path)
+    (workspace / "docs").mkdir()
+
+    preview = write_file_preview(workspace, "docs/../docs/./memo.txt", "x\n")
+
+    assert preview["path"] == "docs/memo.txt"